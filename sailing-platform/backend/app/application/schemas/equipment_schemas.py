@@ -1,10 +1,27 @@
 """Equipment request/response schemas."""
 from datetime import date, datetime
-from typing import Optional, Literal
+from typing import Annotated, Any, List, Optional, Sequence, Tuple
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
+import msgspec
+from msgspec import Meta
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
-EquipmentType = Literal["Mainsail", "Jib", "Gennaker", "Mast", "Boom", "Rudder", "Centerboard", "Other"]
+from app.application.schemas.validation import attach_fast_validator
+from app.domain.entities.equipment import Equipment, EquipmentType
+
+# Response fields derived from entity behaviour rather than plain attributes
+_COMPUTED_FIELDS = frozenset({"age_in_days", "needs_replacement"})
+
+
+def compute_equipment_derived(
+        equipment_list: Sequence[Equipment],
+        today: date
+) -> Tuple[List[Optional[int]], List[bool]]:
+    """Compute age_in_days and needs_replacement for a list of equipment."""
+    return (
+        [e.age_in_days_from(today) for e in equipment_list],
+        [e.needs_replacement() for e in equipment_list]
+    )
 
 
 class EquipmentBase(BaseModel):
@@ -22,6 +39,17 @@ class EquipmentCreate(EquipmentBase):
     pass
 
 
+class EquipmentCreateStruct(msgspec.Struct, kw_only=True):
+    """Equipment creation body decoded with msgspec (mirrors EquipmentCreate)."""
+    name: Annotated[str, Meta(min_length=1, max_length=100)]
+    type: EquipmentType
+    manufacturer: Annotated[str, Meta(min_length=1, max_length=100)]
+    model: Annotated[str, Meta(min_length=1, max_length=100)]
+    purchase_date: Optional[date] = None
+    notes: Optional[str] = None
+
+
+@attach_fast_validator
 class EquipmentUpdate(BaseModel):
     """Equipment update schema."""
     name: Optional[str] = Field(None, min_length=1, max_length=100)
@@ -45,6 +73,34 @@ class EquipmentResponse(EquipmentBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_orm_fast(cls, obj: Any, today: Optional[date] = None) -> "EquipmentResponse":
+        """Build response from trusted domain data, skipping field validation."""
+        return cls._construct(
+            obj,
+            obj.age_in_days_from(today or date.today()),
+            obj.needs_replacement()
+        )
+
+    @classmethod
+    def list_from_orm_fast(
+            cls,
+            objs: Sequence[Any],
+            today: Optional[date] = None
+    ) -> List["EquipmentResponse"]:
+        """Build responses for a list, computing derived fields in one pass."""
+        ages, needs = compute_equipment_derived(objs, today or date.today())
+        return [cls._construct(obj, age, need) for obj, age, need in zip(objs, ages, needs)]
+
+    @classmethod
+    def _construct(cls, obj: Any, age_in_days: Optional[int], needs_replacement: bool) -> "EquipmentResponse":
+        data = {f: getattr(obj, f) for f in cls.model_fields if f not in _COMPUTED_FIELDS}
+        return cls.model_construct(
+            **data,
+            age_in_days=age_in_days,
+            needs_replacement=needs_replacement
+        )
+
 
 class EquipmentStatistics(BaseModel):
     """Equipment statistics response schema."""
@@ -54,4 +110,8 @@ class EquipmentStatistics(BaseModel):
     equipment_by_type: dict[str, int]
     oldest_equipment: Optional[str]
     newest_equipment: Optional[str]
-    most_worn_equipment: Optional[dict[str, float]] = None  # name: wear_hours
\ No newline at end of file
+    most_worn_equipment: Optional[dict[str, float]] = None  # name: wear_hours
+
+
+# Serializes a whole response list in one pydantic-core call
+EquipmentListAdapter = TypeAdapter(List[EquipmentResponse])
@@ -1,12 +1,15 @@
 """Session request/response schemas."""
+import datetime as dt
 from datetime import date, datetime
-from typing import Optional, Literal, List
+from typing import Annotated, Any, Optional, List
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
+import msgspec
+from msgspec import Meta
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from app.application.schemas.equipment_schemas import EquipmentResponse
-
-WaveType = Literal["Flat", "Choppy", "Medium", "Large"]
-TensionLevel = Literal["Loose", "Medium", "Tight"]
+from app.application.schemas.validation import attach_fast_validator
+from app.domain.entities.equipment import TensionLevel
+from app.domain.entities.session import WaveType
 
 
 class SessionBase(BaseModel):
@@ -27,9 +30,25 @@ class SessionCreate(SessionBase):
     equipment_ids: List[UUID] = Field(default_factory=list, description="Equipment used in this session")
 
 
+class SessionCreateStruct(msgspec.Struct, kw_only=True):
+    """Session creation body decoded with msgspec (mirrors SessionCreate)."""
+    date: date
+    location: Annotated[str, Meta(min_length=1, max_length=255)]
+    wind_speed_min: Annotated[float, Meta(ge=0, le=60)]
+    wind_speed_max: Annotated[float, Meta(ge=0, le=60)]
+    wave_type: WaveType
+    wave_direction: Annotated[str, Meta(min_length=1, max_length=50)]
+    hours_on_water: Annotated[float, Meta(gt=0, le=12)]
+    performance_rating: Annotated[int, Meta(ge=1, le=5)]
+    notes: Optional[str] = None
+    equipment_ids: List[UUID] = msgspec.field(default_factory=list)
+
+
+@attach_fast_validator
 class SessionUpdate(BaseModel):
     """Session update schema."""
-    date: Optional[date] = None
+    # Annotated via the module so the field name does not shadow the type
+    date: Optional[dt.date] = None
     location: Optional[str] = Field(None, min_length=1, max_length=255)
     wind_speed_min: Optional[float] = Field(None, ge=0, le=60)
     wind_speed_max: Optional[float] = Field(None, ge=0, le=60)
@@ -68,6 +87,28 @@ class EquipmentSettingsCreate(EquipmentSettingsBase):
     pass
 
 
+class EquipmentSettingsCreateStruct(msgspec.Struct, kw_only=True):
+    """Equipment settings creation body decoded with msgspec (mirrors EquipmentSettingsCreate)."""
+    # Rig tensions
+    forestay_tension: Annotated[float, Meta(ge=0, le=10)]
+    shroud_tension: Annotated[float, Meta(ge=0, le=10)]
+    mast_rake: Annotated[float, Meta(ge=-5, le=30)]
+
+    # New rig measurements with defaults
+    main_tension: Annotated[float, Meta(ge=0, le=10)] = 0.0
+    cap_tension: Annotated[float, Meta(ge=0, le=10)] = 0.0
+    cap_hole: Annotated[float, Meta(ge=0)] = 0.0
+    lowers_scale: Annotated[float, Meta(ge=0, le=10)] = 0.0
+    mains_scale: Annotated[float, Meta(ge=0, le=10)] = 0.0
+    pre_bend: Annotated[float, Meta(ge=-50, le=200)] = 0.0
+
+    # Sail controls
+    jib_halyard_tension: TensionLevel
+    cunningham: Annotated[float, Meta(ge=0, le=10)]
+    outhaul: Annotated[float, Meta(ge=0, le=10)]
+    vang: Annotated[float, Meta(ge=0, le=10)]
+
+
 class EquipmentSettingsUpdate(BaseModel):
     """Equipment settings update schema."""
     # All fields optional for update
@@ -96,6 +137,11 @@ class EquipmentSettingsResponse(EquipmentSettingsBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "EquipmentSettingsResponse":
+        """Build response from trusted domain data, skipping field validation."""
+        return cls.model_construct(**{f: getattr(obj, f) for f in cls.model_fields})
+
 
 class SessionResponse(SessionBase):
     """Session response schema."""
@@ -106,6 +152,16 @@ class SessionResponse(SessionBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_orm_fast(cls, obj: Any, **extra: Any) -> "SessionResponse":
+        """Build response from trusted domain data, skipping field validation.
+
+        Fields not present on the source object (e.g. nested relations on
+        subclasses) must be supplied through ``extra``.
+        """
+        data = {f: extra[f] if f in extra else getattr(obj, f) for f in cls.model_fields}
+        return cls.model_construct(**data)
+
 
 class SessionWithEquipmentResponse(SessionResponse):
     """Session response with equipment list."""
@@ -125,4 +181,8 @@ class PerformanceAnalytics(BaseModel):
     average_performance: float
     performance_by_conditions: dict[str, float]
     sessions_by_location: dict[str, int]
-    equipment_usage: dict[str, int] = Field(default_factory=dict, description="Equipment usage count by name")
\ No newline at end of file
+    equipment_usage: dict[str, int] = Field(default_factory=dict, description="Equipment usage count by name")
+
+
+# Serializes a whole response list in one pydantic-core call
+SessionListAdapter = TypeAdapter(List[SessionResponse])
@@ -0,0 +1,135 @@
+"""Generated request validators for flat Pydantic schemas.
+
+``compile_validator`` reads a schema's field annotations and constraint
+metadata once and emits a straight-line Python function that checks and
+coerces a decoded JSON object. The common, already well-typed input of each
+field is handled inline; anything else is handed to Pydantic for that field,
+so accepted input, coercions and error messages match the schema itself.
+The result can be fed to ``model_construct`` without a second validation pass.
+"""
+import types
+from datetime import date
+from typing import Annotated, Any, Callable, Dict, List, Literal, Tuple, Type, Union, get_args, get_origin
+
+from annotated_types import Ge, Gt, Le, Lt, MaxLen, MinLen
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+FastValidator = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+_BOUND_OPS = ((Ge, "ge", ">="), (Gt, "gt", ">"), (Le, "le", "<="), (Lt, "lt", "<"))
+
+
+class FieldValidationError(ValueError):
+    """An invalid field, located relative to the validated object as Pydantic reports it."""
+
+    def __init__(self, loc: Tuple[Any, ...], msg: str, error_type: str):
+        super().__init__(f"{loc[0]}: {msg}")
+        self.loc = loc
+        self.msg = msg
+        self.type = error_type
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Strip ``Optional[...]`` from an annotation."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _pydantic_check(name: str, annotation: Any, metadata: List[Any]) -> Callable[[Any], Any]:
+    """Validate a single field value with Pydantic, for input the inline checks do not take."""
+    adapter = TypeAdapter(Annotated[(annotation, *metadata)] if metadata else annotation)
+
+    def check(v: Any) -> Any:
+        try:
+            return adapter.validate_python(v)
+        except ValidationError as e:
+            error = e.errors()[0]
+            raise FieldValidationError((name, *error["loc"]), error["msg"], error["type"]) from None
+
+    return check
+
+
+def _constraint_conditions(subject: str, metadata: List[Any]) -> List[str]:
+    """Conditions that hold when ``subject`` satisfies the field's bound and length constraints."""
+    conditions = []
+    for item in metadata:
+        for kind, attr, op in _BOUND_OPS:
+            if isinstance(item, kind):
+                conditions.append(f"{subject} {op} {getattr(item, attr)!r}")
+        if isinstance(item, MinLen):
+            conditions.append(f"len({subject}) >= {item.min_length!r}")
+        if isinstance(item, MaxLen):
+            conditions.append(f"len({subject}) <= {item.max_length!r}")
+    return conditions
+
+
+def _fast_path_lines(name: str, annotation: Any, metadata: List[Any], ns: Dict[str, Any]) -> List[str]:
+    """Emit source lines that accept the common input for ``annotation`` inline, else defer to Pydantic."""
+    slow = f"v = _check_{name}(v)"
+
+    if annotation is float:
+        # bool is an int subclass; Pydantic's coercion of it is left to Pydantic
+        conditions = ["(type(v) is float or type(v) is int)"] + _constraint_conditions("v", metadata)
+        return [f"if {' and '.join(conditions)}:", "    v = float(v)", "else:", f"    {slow}"]
+    if annotation in (int, str):
+        conditions = [f"type(v) is {annotation.__name__}"] + _constraint_conditions("v", metadata)
+        return [f"if not ({' and '.join(conditions)}):", f"    {slow}"]
+    if annotation is date:
+        # Only plain YYYY-MM-DD; date.fromisoformat alone also takes forms Pydantic rejects
+        return [
+            "if type(v) is str and len(v) == 10 and v[4] == '-' and v[7] == '-' and v.isascii():",
+            "    try:",
+            "        v = date.fromisoformat(v)",
+            "    except ValueError:",
+            f"        {slow}",
+            "else:",
+            f"    {slow}",
+        ]
+    if get_origin(annotation) is Literal:
+        ns[f"_allowed_{name}"] = frozenset(get_args(annotation))
+        return [f"if type(v) is not str or v not in _allowed_{name}:", f"    {slow}"]
+    return [slow]
+
+
+def compile_validator(schema_cls: Type[BaseModel]) -> FastValidator:
+    """Generate a flat validator function for ``schema_cls``.
+
+    The returned callable takes the decoded JSON object and returns a dict
+    holding only the known, coerced fields, raising ``FieldValidationError``
+    for the first invalid one. Optional fields that are missing or null are
+    skipped.
+    """
+    ns: Dict[str, Any] = {"date": date, "FieldValidationError": FieldValidationError}
+    body = ["out = {}"]
+
+    for name, field in schema_cls.model_fields.items():
+        annotation = _unwrap_optional(field.annotation)
+        ns[f"_check_{name}"] = _pydantic_check(name, annotation, field.metadata)
+        body.append(f"v = d.get({name!r})")
+        if field.is_required():
+            body += [
+                f"if {name!r} not in d:",
+                f"    raise FieldValidationError(({name!r},), 'Field required', 'missing')",
+            ]
+            indent = ""
+        else:
+            body.append("if v is not None:")
+            indent = "    "
+
+        lines = _fast_path_lines(name, annotation, field.metadata, ns)
+        lines.append(f"out[{name!r}] = v")
+        body += [indent + line for line in lines]
+
+    body.append("return out")
+    src = "def _validate(d):\n" + "\n".join("    " + line for line in body) + "\n"
+    exec(compile(src, f"<fast validator {schema_cls.__name__}>", "exec"), ns)
+    return ns["_validate"]
+
+
+def attach_fast_validator(schema_cls: Type[BaseModel]) -> Type[BaseModel]:
+    """Compile and cache the fast validator on ``schema_cls.__fast_validate__``."""
+    schema_cls.__fast_validate__ = compile_validator(schema_cls)
+    return schema_cls
@@ -1,8 +1,12 @@
 """Application configuration using Pydantic Settings."""
+import re
+from functools import lru_cache
 from typing import List, Union
-from pydantic import AnyHttpUrl, field_validator
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+_CORS_ORIGIN_RE = re.compile(r"^https?://")
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -15,6 +19,13 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./sailing_platform.db"
+    DATABASE_ECHO: bool = False  # SQL logging; kept separate from DEBUG as it costs time on every query
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 40
+    DATABASE_POOL_RECYCLE: int = 1800  # seconds
+    DATABASE_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DATABASE_STATEMENT_CACHE_SIZE: int = 512  # prepared statements per asyncpg connection
+    DATABASE_QUERY_CACHE_SIZE: int = 1200  # compiled statements kept per engine
 
     # Security
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
@@ -28,10 +39,15 @@ class Settings(BaseSettings):
     @classmethod
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
         if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
-        elif isinstance(v, (list, str)):
-            return v
-        raise ValueError(v)
+            v = [i.strip() for i in v.split(",") if i.strip()]
+        elif not isinstance(v, (list, str)):
+            raise ValueError(v)
+
+        if isinstance(v, list):
+            for origin in v:
+                if not _CORS_ORIGIN_RE.match(origin):
+                    raise ValueError(f"Invalid CORS origin: {origin}")
+        return v
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -40,5 +56,11 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache()
+def get_settings() -> Settings:
+    """Get the cached settings instance."""
+    return Settings()
+
+
 # Create settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -1,30 +1,106 @@
 """Dependency injection setup for the application."""
-from typing import Annotated
+from typing import Annotated, Any, Callable, Dict, Type, TypeVar
 from functools import lru_cache
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+import msgspec
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import OAuth2PasswordBearer
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError
 
-from app.config import settings
+from app.application.schemas.validation import FieldValidationError
+from app.config import get_settings
 from app.infrastructure.database.connection import get_db
 from app.infrastructure.security.password_hasher import PasswordHasher, IPasswordHasher
 from app.infrastructure.security.jwt_handler import JWTHandler
 from app.infrastructure.database.repositories.user_repository_impl import UserRepository
 from app.infrastructure.database.repositories.session_repository_impl import SessionRepository
 from app.infrastructure.database.repositories.equipment_repository_impl import EquipmentRepository
-from app.domain.repositories.user_repository import IUserRepository
-from app.domain.repositories.session_repository import ISessionRepository
-from app.domain.repositories.equipment_repository import IEquipmentRepository
 from app.domain.services.auth_service import AuthService
 from app.domain.services.session_service import SessionService
 from app.domain.services.equipment_service import EquipmentService
 
+settings = get_settings()
+
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/token")
 
+StructT = TypeVar("StructT", bound=msgspec.Struct)
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+# Request body dependencies
+def msgspec_body(struct_type: Type[StructT], schema_cls: Type[BaseModel]) -> Callable[[Request], Any]:
+    """Build a dependency that decodes the JSON body into a msgspec struct.
+
+    The decoder is created once here and reused for every request. It runs in
+    lax mode, which already takes numeric strings; bodies it still rejects are
+    validated by ``schema_cls``, the documented Pydantic schema, so coercions
+    such as ``4.0`` for an int or a bool for a float are accepted exactly as
+    before, and real errors are reported with their field location.
+    """
+    decoder = msgspec.json.Decoder(struct_type, strict=False)
+
+    async def decode_body(request: Request) -> StructT:
+        body = await request.body()
+        try:
+            return decoder.decode(body)
+        except msgspec.ValidationError:
+            pass
+        except msgspec.DecodeError as e:
+            raise RequestValidationError(
+                [{"loc": ("body",), "msg": str(e), "type": "value_error"}]
+            )
+        try:
+            model = schema_cls.model_validate(msgspec.json.decode(body))
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{"loc": ("body", *error["loc"]), "msg": error["msg"], "type": error["type"]}
+                 for error in e.errors()]
+            )
+        return msgspec.convert(model.model_dump(), struct_type)
+
+    return decode_body
+
+
+def validated_body(schema_cls: Type[ModelT]) -> Callable[[Request], Any]:
+    """Build a dependency that validates the JSON body with the schema's generated validator.
+
+    The schema must have been passed through ``attach_fast_validator``; the
+    checked data is turned into a model with ``model_construct``.
+    """
+    validate = schema_cls.__fast_validate__
+
+    async def decode_body(request: Request) -> ModelT:
+        try:
+            data = msgspec.json.decode(await request.body())
+            if not isinstance(data, dict):
+                raise ValueError("Input should be a valid object")
+            return schema_cls.model_construct(**validate(data))
+        except FieldValidationError as e:
+            raise RequestValidationError(
+                [{"loc": ("body", *e.loc), "msg": e.msg, "type": e.type}]
+            )
+        except (msgspec.DecodeError, ValueError) as e:
+            raise RequestValidationError(
+                [{"loc": ("body",), "msg": str(e), "type": "value_error"}]
+            )
+
+    return decode_body
+
+
+def openapi_body(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body for endpoints that decode the body in a dependency."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
 
 # Infrastructure dependencies
 @lru_cache()
@@ -39,49 +115,29 @@ def get_jwt_handler() -> JWTHandler:
     return JWTHandler()
 
 
-# Repository dependencies
-async def get_user_repository(
-        db: Annotated[AsyncSession, Depends(get_db)]
-) -> IUserRepository:
-    """Get user repository instance."""
-    return UserRepository(db)
-
-
-async def get_session_repository(
-        db: Annotated[AsyncSession, Depends(get_db)]
-) -> ISessionRepository:
-    """Get session repository instance."""
-    return SessionRepository(db)
-
-
-async def get_equipment_repository(
-        db: Annotated[AsyncSession, Depends(get_db)]
-) -> IEquipmentRepository:
-    """Get equipment repository instance."""
-    return EquipmentRepository(db)
-
-
 # Service dependencies
+# Repositories are built inline rather than through their own Depends() nodes,
+# which keeps the per-request dependency graph FastAPI has to solve small.
 async def get_auth_service(
-        user_repository: Annotated[IUserRepository, Depends(get_user_repository)],
+        db: Annotated[AsyncSession, Depends(get_db)],
         password_hasher: Annotated[IPasswordHasher, Depends(get_password_hasher)]
 ) -> AuthService:
     """Get auth service instance."""
-    return AuthService(user_repository, password_hasher)
+    return AuthService(UserRepository(db), password_hasher)
 
 
 async def get_session_service(
-        session_repository: Annotated[ISessionRepository, Depends(get_session_repository)]
+        db: Annotated[AsyncSession, Depends(get_db)]
 ) -> SessionService:
     """Get session service instance."""
-    return SessionService(session_repository)
+    return SessionService(SessionRepository(db), EquipmentRepository(db))
 
 
 async def get_equipment_service(
-        equipment_repository: Annotated[IEquipmentRepository, Depends(get_equipment_repository)]
+        db: Annotated[AsyncSession, Depends(get_db)]
 ) -> EquipmentService:
     """Get equipment service instance."""
-    return EquipmentService(equipment_repository)
+    return EquipmentService(EquipmentRepository(db))
 
 
 # Authentication dependencies
@@ -96,14 +152,11 @@ async def get_current_user_id(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    user_id = jwt_handler.get_user_id_from_token(token)
+    user_id = jwt_handler.get_user_uuid_from_token(token)
     if user_id is None:
         raise credentials_exception
 
-    try:
-        return UUID(user_id)
-    except ValueError:
-        raise credentials_exception
+    return user_id
 
 
 async def get_current_user(
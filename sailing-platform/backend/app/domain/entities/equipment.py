@@ -1,15 +1,45 @@
 """Equipment domain entities with business logic."""
 from datetime import date, datetime, timezone
-from typing import Optional, Literal
-from uuid import UUID, uuid4
-from dataclasses import dataclass, field
+from typing import Any, Optional, Literal, Sequence
+from uuid import UUID
+from dataclasses import dataclass, field, fields
+from functools import partial
 
+from app.domain.entities.ids import uuid7
+
+
+# Timestamp factory; a C-level partial avoids a Python frame per call
+_now_utc = partial(datetime.now, timezone.utc)
 
 EquipmentType = Literal["Mainsail", "Jib", "Gennaker", "Mast", "Boom", "Rudder", "Centerboard", "Other"]
 TensionLevel = Literal["Loose", "Medium", "Tight"]
 
+_EQUIPMENT_TYPES = ("Mainsail", "Jib", "Gennaker", "Mast", "Boom", "Rudder", "Centerboard", "Other")
+_VALID_TYPES: frozenset[str] = frozenset(_EQUIPMENT_TYPES)
+_VALID_TYPES_MSG = "Equipment type must be one of: " + ", ".join(_EQUIPMENT_TYPES)
+
+_HALYARD_TENSIONS = ("Loose", "Medium", "Tight")
+_VALID_HALYARD_TENSIONS: frozenset[str] = frozenset(_HALYARD_TENSIONS)
+_VALID_HALYARD_TENSIONS_MSG = "Jib halyard tension must be one of: " + ", ".join(_HALYARD_TENSIONS)
+
+# Wear hours after which equipment is due for replacement
+DEFAULT_WEAR_THRESHOLD = 500.0
 
-@dataclass
+# Settings on a 0-10 scale
+_TENSION_ATTRS = (
+    "forestay_tension",
+    "shroud_tension",
+    "main_tension",
+    "cap_tension",
+    "lowers_scale",
+    "mains_scale",
+    "cunningham",
+    "outhaul",
+    "vang",
+)
+
+
+@dataclass(slots=True)
 class Equipment:
     """Equipment domain entity."""
 
@@ -22,9 +52,9 @@ class Equipment:
     notes: Optional[str] = None
     active: bool = True
     wear: float = 0.0  # Total hours of use
-    id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    id: UUID = field(default_factory=uuid7)
+    created_at: datetime = field(default_factory=_now_utc)
+    updated_at: datetime = field(default_factory=_now_utc)
 
     def __post_init__(self):
         """Validate equipment data after initialization."""
@@ -32,6 +62,25 @@ class Equipment:
         self._validate_type()
         self._validate_wear()
 
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "Equipment":
+        """Build equipment from already-validated data (e.g. database rows).
+
+        Skips ``__post_init__`` validation; every field must be supplied.
+        """
+        equipment = object.__new__(cls)
+        for name in _EQUIPMENT_FIELDS:
+            setattr(equipment, name, values[name])
+        return equipment
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "Equipment":
+        """Like ``from_trusted`` but takes every value positionally, in field order."""
+        equipment = object.__new__(cls)
+        for name, value in zip(_EQUIPMENT_FIELDS, row):
+            setattr(equipment, name, value)
+        return equipment
+
     def _validate_name(self) -> None:
         """Validate equipment name."""
         if not self.name or len(self.name.strip()) < 1:
@@ -41,9 +90,8 @@ class Equipment:
 
     def _validate_type(self) -> None:
         """Validate equipment type."""
-        valid_types = ["Mainsail", "Jib", "Gennaker", "Mast", "Boom", "Rudder", "Centerboard", "Other"]
-        if self.type not in valid_types:
-            raise ValueError(f"Equipment type must be one of: {', '.join(valid_types)}")
+        if self.type not in _VALID_TYPES:
+            raise ValueError(_VALID_TYPES_MSG)
 
     def _validate_wear(self) -> None:
         """Validate wear value."""
@@ -53,25 +101,29 @@ class Equipment:
     def retire(self) -> None:
         """Retire the equipment."""
         self.active = False
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now_utc()
 
     def reactivate(self) -> None:
         """Reactivate retired equipment."""
         self.active = True
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now_utc()
 
     def add_wear(self, hours: float) -> None:
         """Add wear hours to equipment."""
         if hours < 0:
             raise ValueError("Cannot add negative wear hours")
         self.wear += hours
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now_utc()
 
     @property
     def age_in_days(self) -> Optional[int]:
         """Calculate equipment age in days."""
+        return self.age_in_days_from(date.today())
+
+    def age_in_days_from(self, today: date) -> Optional[int]:
+        """Calculate equipment age in days relative to a given date."""
         if self.purchase_date:
-            return (date.today() - self.purchase_date).days
+            return (today - self.purchase_date).days
         return None
 
     def is_old(self, threshold_days: int = 730) -> bool:
@@ -79,12 +131,12 @@ class Equipment:
         age = self.age_in_days
         return age is not None and age > threshold_days
 
-    def needs_replacement(self, wear_threshold: float = 500.0) -> bool:
+    def needs_replacement(self, wear_threshold: float = DEFAULT_WEAR_THRESHOLD) -> bool:
         """Check if equipment needs replacement based on wear."""
         return self.wear > wear_threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentSettings:
     """Equipment settings for a specific sailing session."""
 
@@ -109,30 +161,29 @@ class EquipmentSettings:
     mains_scale: float = 0.0  # 0-10 scale
     pre_bend: float = 0.0  # mm or inches
 
-    id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    id: UUID = field(default_factory=uuid7)
+    created_at: datetime = field(default_factory=_now_utc)
 
     def __post_init__(self):
         """Validate settings data after initialization."""
         self._validate_tensions()
         self._validate_mast_rake()
 
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "EquipmentSettings":
+        """Build settings from already-validated data (e.g. database rows).
+
+        Skips ``__post_init__`` validation; every field must be supplied.
+        """
+        settings = object.__new__(cls)
+        for name in _SETTINGS_FIELDS:
+            setattr(settings, name, values[name])
+        return settings
+
     def _validate_tensions(self) -> None:
         """Validate all tension values."""
-        tension_fields = [
-            ('forestay_tension', self.forestay_tension),
-            ('shroud_tension', self.shroud_tension),
-            ('main_tension', self.main_tension),
-            ('cap_tension', self.cap_tension),
-            ('lowers_scale', self.lowers_scale),
-            ('mains_scale', self.mains_scale),
-            ('cunningham', self.cunningham),
-            ('outhaul', self.outhaul),
-            ('vang', self.vang)
-        ]
-
-        for field_name, value in tension_fields:
-            if not 0 <= value <= 10:
+        for field_name in _TENSION_ATTRS:
+            if not 0 <= getattr(self, field_name) <= 10:
                 raise ValueError(f"{field_name} must be between 0 and 10")
 
         # Validate cap_hole separately as it might have different range
@@ -143,9 +194,8 @@ class EquipmentSettings:
         if not -50 <= self.pre_bend <= 200:  # Reasonable range in mm
             raise ValueError("pre_bend must be between -50 and 200 mm")
 
-        valid_halyard_tensions = ["Loose", "Medium", "Tight"]
-        if self.jib_halyard_tension not in valid_halyard_tensions:
-            raise ValueError(f"Jib halyard tension must be one of: {', '.join(valid_halyard_tensions)}")
+        if self.jib_halyard_tension not in _VALID_HALYARD_TENSIONS:
+            raise ValueError(_VALID_HALYARD_TENSIONS_MSG)
 
     def _validate_mast_rake(self) -> None:
         """Validate mast rake angle."""
@@ -170,4 +220,8 @@ class EquipmentSettings:
             self.cunningham < 3 and
             self.jib_halyard_tension == "Loose" and
             self.main_tension < 3
-        )
\ No newline at end of file
+        )
+
+
+_EQUIPMENT_FIELDS = tuple(f.name for f in fields(Equipment))
+_SETTINGS_FIELDS = tuple(f.name for f in fields(EquipmentSettings))
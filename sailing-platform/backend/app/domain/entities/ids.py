@@ -0,0 +1,21 @@
+"""Identifier generation for domain entities."""
+import os
+import time
+from uuid import UUID
+
+_RAND_B_MASK = (1 << 62) - 1
+_VERSION_7 = 0x7 << 76
+_VARIANT_RFC = 0b10 << 62
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so new IDs sort
+    after older ones and primary-key inserts stay at the end of the index.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = (rand >> 62) & 0xFFF
+    rand_b = rand & _RAND_B_MASK
+    return UUID(int=(unix_ms << 80) | _VERSION_7 | (rand_a << 64) | _VARIANT_RFC | rand_b)
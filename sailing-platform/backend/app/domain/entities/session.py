@@ -1,14 +1,35 @@
 """Sailing session domain entity with business logic."""
+import sys
 from datetime import date, datetime, timezone
-from typing import Optional, Literal, List
-from uuid import UUID, uuid4
-from dataclasses import dataclass, field
+from typing import Any, Optional, Literal, List
+from uuid import UUID
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
+from functools import partial
 
+from app.domain.entities.ids import uuid7
+
+
+_now_utc = partial(datetime.now, timezone.utc)
 
 WaveType = Literal["Flat", "Choppy", "Medium", "Large"]
 
 
-@dataclass
+class WaveSeverity(IntEnum):
+    """Ordinal wave state, for integer comparisons in the weather checks."""
+
+    FLAT = 0
+    CHOPPY = 1
+    MEDIUM = 2
+    LARGE = 3
+
+
+_WAVE_TYPES = ("Flat", "Choppy", "Medium", "Large")
+WAVE_SEVERITY = {name: WaveSeverity[name.upper()] for name in _WAVE_TYPES}
+_WAVE_TYPE_ERR = "Wave type must be one of: " + ", ".join(_WAVE_TYPES)
+
+
+@dataclass(slots=True)
 class SailingSession:
     """Sailing session domain entity."""
 
@@ -23,16 +44,38 @@ class SailingSession:
     created_by: UUID
     notes: Optional[str] = None
     equipment_ids: List[UUID] = field(default_factory=list)  # Equipment used in this session
-    id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    id: UUID = field(default_factory=uuid7)
+    created_at: datetime = field(default_factory=_now_utc)
+    updated_at: Optional[datetime] = None  # defaults to created_at
+    wave_severity: WaveSeverity = field(init=False, repr=False, compare=False)  # derived from wave_type
+    _avg_wind: float = field(init=False, repr=False, compare=False)  # derived from wind speeds
 
     def __post_init__(self):
         """Validate session data after initialization."""
+        if self.updated_at is None:
+            # New session: reuse the creation timestamp instead of reading the clock twice
+            self.updated_at = self.created_at
         self._validate_wind_speed()
         self._validate_performance_rating()
         self._validate_hours_on_water()
         self._validate_wave_type()
+        self._intern_labels()
+
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "SailingSession":
+        """Build a session from already-validated data (e.g. database rows).
+
+        Skips the ``__post_init__`` validators but still fills the derived fields.
+        """
+        session = object.__new__(cls)
+        for name in _SESSION_FIELDS:
+            setattr(session, name, values[name])
+        if session.updated_at is None:
+            session.updated_at = session.created_at
+        session.wave_severity = WAVE_SEVERITY[session.wave_type]
+        session._avg_wind = (session.wind_speed_min + session.wind_speed_max) * 0.5
+        session._intern_labels()
+        return session
 
     def _validate_wind_speed(self) -> None:
         """Validate wind speed values."""
@@ -44,6 +87,7 @@ class SailingSession:
             raise ValueError("Minimum wind speed cannot exceed maximum wind speed")
         if self.wind_speed_max > 60:  # Safety limit for 49er sailing
             raise ValueError("Wind speed exceeds safe sailing conditions")
+        self._avg_wind = (self.wind_speed_min + self.wind_speed_max) * 0.5
 
     def _validate_performance_rating(self) -> None:
         """Validate performance rating."""
@@ -59,14 +103,22 @@ class SailingSession:
 
     def _validate_wave_type(self) -> None:
         """Validate wave type."""
-        valid_types = ["Flat", "Choppy", "Medium", "Large"]
-        if self.wave_type not in valid_types:
-            raise ValueError(f"Wave type must be one of: {', '.join(valid_types)}")
+        severity = WAVE_SEVERITY.get(self.wave_type)
+        if severity is None:
+            raise ValueError(_WAVE_TYPE_ERR)
+        self.wave_severity = severity
+
+    def _intern_labels(self) -> None:
+        """Share one string object per distinct location/wave direction."""
+        if isinstance(self.location, str):
+            self.location = sys.intern(self.location)
+        if isinstance(self.wave_direction, str):
+            self.wave_direction = sys.intern(self.wave_direction)
 
     @property
     def average_wind_speed(self) -> float:
-        """Calculate average wind speed."""
-        return (self.wind_speed_min + self.wind_speed_max) / 2
+        """Average wind speed, cached when the wind speeds are validated."""
+        return self._avg_wind
 
     @property
     def wind_range(self) -> float:
@@ -75,23 +127,23 @@ class SailingSession:
 
     def is_heavy_weather(self) -> bool:
         """Check if session was in heavy weather conditions."""
-        return self.average_wind_speed > 20 or self.wave_type in ["Medium", "Large"]
+        return self._avg_wind > 20 or self.wave_severity >= WaveSeverity.MEDIUM
 
     def is_light_weather(self) -> bool:
         """Check if session was in light weather conditions."""
-        return self.average_wind_speed < 8 and self.wave_type in ["Flat", "Choppy"]
+        return self._avg_wind < 8 and self.wave_severity <= WaveSeverity.CHOPPY
 
     def add_equipment(self, equipment_id: UUID) -> None:
         """Add equipment to the session."""
         if equipment_id not in self.equipment_ids:
             self.equipment_ids.append(equipment_id)
-            self.updated_at = datetime.now(timezone.utc)
+            self.updated_at = _now_utc()
 
     def remove_equipment(self, equipment_id: UUID) -> None:
         """Remove equipment from the session."""
         if equipment_id in self.equipment_ids:
             self.equipment_ids.remove(equipment_id)
-            self.updated_at = datetime.now(timezone.utc)
+            self.updated_at = _now_utc()
 
     def update(self, **kwargs) -> None:
         """Update session with validation."""
@@ -102,12 +154,34 @@ class SailingSession:
                 old_values[key] = getattr(self, key)
                 setattr(self, key, value)
 
-        # Validate
+        # Validate only the rules that depend on the changed fields
+        validators = dict.fromkeys(
+            validator for key in old_values for validator in _FIELD_VALIDATORS.get(key, ())
+        )
         try:
-            self.__post_init__()
-            self.updated_at = datetime.now(timezone.utc)
+            for validator in validators:
+                validator(self)
+            self.updated_at = _now_utc()
         except ValueError:
             # Rollback on validation error
             for key, value in old_values.items():
                 setattr(self, key, value)
-            raise
\ No newline at end of file
+            # Validators also cache derived values; recompute them from the restored fields
+            for validator in validators:
+                validator(self)
+            raise
+
+
+# Validators (and normalizers) to re-run in ``SailingSession.update`` when a field changes
+_FIELD_VALIDATORS = {
+    "location": (SailingSession._intern_labels,),
+    "wave_direction": (SailingSession._intern_labels,),
+    "wind_speed_min": (SailingSession._validate_wind_speed,),
+    "wind_speed_max": (SailingSession._validate_wind_speed,),
+    "performance_rating": (SailingSession._validate_performance_rating,),
+    "hours_on_water": (SailingSession._validate_hours_on_water,),
+    "wave_type": (SailingSession._validate_wave_type,),
+}
+
+
+_SESSION_FIELDS = tuple(f.name for f in fields(SailingSession) if f.init)
@@ -1,11 +1,21 @@
 """User domain entity with business logic."""
+import re
 from datetime import datetime, timezone
-from typing import Optional
-from uuid import UUID, uuid4
-from dataclasses import dataclass, field
+from typing import Any, Optional
+from uuid import UUID
+from dataclasses import dataclass, field, fields
+from functools import partial
 
+from app.domain.entities.ids import uuid7
 
-@dataclass
+
+_now_utc = partial(datetime.now, timezone.utc)
+
+# Letters, digits, underscores and hyphens, with at least one letter or digit; 3-50 characters
+_USERNAME_RE = re.compile(r"(?=[\w-]*[^\W_])[\w-]{3,50}")
+
+
+@dataclass(slots=True)
 class User:
     """User domain entity representing a sailing platform user."""
 
@@ -13,14 +23,25 @@ class User:
     username: str
     hashed_password: str
     is_active: bool = True
-    id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    id: UUID = field(default_factory=uuid7)
+    created_at: datetime = field(default_factory=_now_utc)
 
     def __post_init__(self):
         """Validate user data after initialization."""
         self._validate_email()
         self._validate_username()
 
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "User":
+        """Build a user from already-validated data (e.g. database rows).
+
+        Skips ``__post_init__`` validation; every field must be supplied.
+        """
+        user = object.__new__(cls)
+        for name in _USER_FIELDS:
+            setattr(user, name, values[name])
+        return user
+
     def _validate_email(self) -> None:
         """Validate email format."""
         if not self.email or "@" not in self.email:
@@ -30,12 +51,14 @@ class User:
 
     def _validate_username(self) -> None:
         """Validate username."""
+        if self.username and _USERNAME_RE.fullmatch(self.username):
+            return
+        # Slow path only to pick the error message
         if not self.username or len(self.username) < 3:
             raise ValueError("Username must be at least 3 characters")
         if len(self.username) > 50:
             raise ValueError("Username too long")
-        if not self.username.replace("_", "").replace("-", "").isalnum():
-            raise ValueError("Username can only contain letters, numbers, underscores, and hyphens")
+        raise ValueError("Username can only contain letters, numbers, underscores, and hyphens")
 
     def deactivate(self) -> None:
         """Deactivate the user account."""
@@ -57,4 +80,7 @@ class User:
             self._validate_email()
         except ValueError:
             self.email = old_email
-            raise
\ No newline at end of file
+            raise
+
+
+_USER_FIELDS = tuple(f.name for f in fields(User))
@@ -1,6 +1,6 @@
 """Equipment repository interface."""
 from abc import abstractmethod
-from typing import List
+from typing import Any, Dict, Iterable, List
 from uuid import UUID
 
 from app.domain.entities.equipment import Equipment, EquipmentType
@@ -15,6 +15,19 @@ class IEquipmentRepository(IRepository[Equipment]):
         """Get all equipment for a specific user."""
         pass
 
+    @abstractmethod
+    async def create_many(self, entities: List[Equipment]) -> List[Equipment]:
+        """Create several pieces of equipment with a single batched INSERT."""
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, equipment_ids: Iterable[UUID]) -> Dict[UUID, Equipment]:
+        """Get several pieces of equipment in one query, keyed by ID.
+
+        IDs that do not exist are simply absent from the result.
+        """
+        pass
+
     @abstractmethod
     async def get_by_type(self, user_id: UUID, equipment_type: EquipmentType) -> List[Equipment]:
         """Get equipment by type for a user."""
@@ -28,4 +41,29 @@ class IEquipmentRepository(IRepository[Equipment]):
     @abstractmethod
     async def reactivate(self, equipment_id: UUID) -> bool:
         """Reactivate retired equipment."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def retire_if_owned(self, equipment_id: UUID, owner_id: UUID) -> bool:
+        """Retire equipment only if it belongs to ``owner_id``."""
+        pass
+
+    @abstractmethod
+    async def reactivate_if_owned(self, equipment_id: UUID, owner_id: UUID) -> bool:
+        """Reactivate equipment only if it belongs to ``owner_id``."""
+        pass
+
+    @abstractmethod
+    async def delete_if_owned(self, equipment_id: UUID, owner_id: UUID) -> bool:
+        """Delete equipment only if it belongs to ``owner_id``."""
+        pass
+
+    @abstractmethod
+    async def get_statistics(self, user_id: UUID) -> Dict[str, Any]:
+        """Get aggregate equipment figures for a user.
+
+        Returns ``by_type`` (type -> (total, active) counts), the names of the
+        ``oldest`` and ``newest`` purchases, and ``most_worn`` as up to three
+        ``(name, wear)`` pairs with non-zero wear, most worn first.
+        """
+        pass
@@ -1,6 +1,6 @@
 """Session repository interface."""
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import date
 from uuid import UUID
 
@@ -13,8 +13,18 @@ class ISessionRepository(IRepository[SailingSession]):
     """Sailing session repository interface with session-specific methods."""
 
     @abstractmethod
-    async def get_by_user(self, user_id: UUID, skip: int = 0, limit: int = 100) -> List[SailingSession]:
-        """Get all sessions for a specific user."""
+    async def get_by_user(
+            self,
+            user_id: UUID,
+            skip: int = 0,
+            limit: int = 100,
+            after: Optional[Tuple[date, UUID]] = None
+    ) -> List[SailingSession]:
+        """Get a user's sessions, newest first.
+
+        ``after`` is the ``(date, id)`` of the last session of the previous page;
+        only sessions that sort after it are returned (keyset pagination).
+        """
         pass
 
     @abstractmethod
@@ -50,4 +60,49 @@ class ISessionRepository(IRepository[SailingSession]):
     @abstractmethod
     async def get_session_equipment(self, session_id: UUID) -> List[Equipment]:
         """Get all equipment used in a session."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_session_equipment_for_user(
+            self,
+            session_id: UUID,
+            user_id: UUID
+    ) -> Optional[List[Equipment]]:
+        """Get the equipment used in a session, or ``None`` if ``user_id`` does not own it."""
+        pass
+
+    @abstractmethod
+    async def get_owner_id(self, session_id: UUID) -> Optional[UUID]:
+        """Get the ID of the user who created a session, or ``None`` if it does not exist."""
+        pass
+
+    @abstractmethod
+    async def delete_if_owned(self, session_id: UUID, user_id: UUID) -> bool:
+        """Delete a session only if it was created by ``user_id``."""
+        pass
+
+    @abstractmethod
+    async def get_analytics_summary(
+            self,
+            user_id: UUID,
+            start_date: Optional[date] = None,
+            end_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """Aggregate a user's sessions per condition bucket and per location.
+
+        Returns ``by_condition`` as ``(bucket, sessions, hours, rating_sum)``
+        rows, where bucket is ``"heavy"``, ``"light"`` or ``"medium"``, and
+        ``by_location`` as ``(location, sessions)`` rows. Both are ordered by
+        their most recent session.
+        """
+        pass
+
+    @abstractmethod
+    async def get_equipment_usage_counts(
+            self,
+            user_id: UUID,
+            start_date: Optional[date] = None,
+            end_date: Optional[date] = None
+    ) -> Dict[UUID, int]:
+        """Count the user's sessions per equipment ID."""
+        pass
@@ -1,6 +1,6 @@
 """User repository interface."""
 from abc import abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
 
 from app.domain.entities.user import User
@@ -28,4 +28,14 @@ class IUserRepository(IRepository[User]):
     @abstractmethod
     async def exists_by_username(self, username: str) -> bool:
         """Check if user exists by username."""
+        pass
+
+    @abstractmethod
+    async def get_with_email_conflict(self, user_id: UUID, email: str) -> Tuple[Optional[User], bool]:
+        """Get user by ID and whether another user already has ``email``."""
+        pass
+
+    @abstractmethod
+    async def exists_by_email_or_username(self, email: str, username: str) -> Tuple[bool, bool]:
+        """Check in one query whether the email and/or username are taken."""
         pass
\ No newline at end of file
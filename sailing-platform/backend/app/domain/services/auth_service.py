@@ -26,17 +26,20 @@ class AuthService:
     ) -> User:
         """Register a new user with validation."""
         # Check if user already exists
-        if await self.user_repository.exists_by_email(email):
+        email_exists, username_exists = await self.user_repository.exists_by_email_or_username(
+            email, username
+        )
+        if email_exists:
             raise ValueError("Email already registered")
 
-        if await self.user_repository.exists_by_username(username):
+        if username_exists:
             raise ValueError("Username already taken")
 
         # Validate password strength
         self._validate_password(password)
 
         # Hash password
-        hashed_password = self.password_hasher.hash_password(password)
+        hashed_password = await self.password_hasher.hash_password_async(password)
 
         # Create user entity
         user = User(
@@ -64,7 +67,7 @@ class AuthService:
             return None
 
         # Verify password
-        if not self.password_hasher.verify_password(password, user.hashed_password):
+        if not await self.password_hasher.verify_password_async(password, user.hashed_password):
             return None
 
         return user
@@ -75,15 +78,13 @@ class AuthService:
 
     async def update_user_email(self, user_id: UUID, new_email: str) -> User:
         """Update user email with validation."""
-        # Get existing user
-        user = await self.user_repository.get_by_id(user_id)
+        # Get existing user and check if new email is taken by someone else
+        user, email_taken = await self.user_repository.get_with_email_conflict(user_id, new_email)
         if not user:
             raise ValueError("User not found")
 
-        # Check if new email is already taken
-        if new_email != user.email:
-            if await self.user_repository.exists_by_email(new_email):
-                raise ValueError("Email already registered")
+        if email_taken:
+            raise ValueError("Email already registered")
 
         # Update email
         user.update_email(new_email)
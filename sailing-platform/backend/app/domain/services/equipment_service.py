@@ -1,7 +1,6 @@
 """Equipment domain service."""
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from collections import defaultdict
 
 from app.domain.entities.equipment import Equipment, EquipmentType
 from app.domain.repositories.equipment_repository import IEquipmentRepository
@@ -76,12 +75,7 @@ class EquipmentService:
             user_id: UUID
     ) -> bool:
         """Retire equipment if user owns it."""
-        # Check ownership
-        equipment = await self.equipment_repository.get_by_id(equipment_id)
-        if not equipment or equipment.owner_id != user_id:
-            return False
-
-        return await self.equipment_repository.retire(equipment_id)
+        return await self.equipment_repository.retire_if_owned(equipment_id, user_id)
 
     async def reactivate_equipment(
             self,
@@ -89,12 +83,7 @@ class EquipmentService:
             user_id: UUID
     ) -> bool:
         """Reactivate retired equipment if user owns it."""
-        # Check ownership
-        equipment = await self.equipment_repository.get_by_id(equipment_id)
-        if not equipment or equipment.owner_id != user_id:
-            return False
-
-        return await self.equipment_repository.reactivate(equipment_id)
+        return await self.equipment_repository.reactivate_if_owned(equipment_id, user_id)
 
     async def delete_equipment(
             self,
@@ -102,12 +91,7 @@ class EquipmentService:
             user_id: UUID
     ) -> bool:
         """Delete equipment if user owns it."""
-        # Check ownership
-        equipment = await self.equipment_repository.get_by_id(equipment_id)
-        if not equipment or equipment.owner_id != user_id:
-            return False
-
-        return await self.equipment_repository.delete(equipment_id)
+        return await self.equipment_repository.delete_if_owned(equipment_id, user_id)
 
     async def add_wear_to_equipment(
             self,
@@ -132,9 +116,10 @@ class EquipmentService:
             user_id: UUID
     ) -> Dict[str, Any]:
         """Get equipment statistics for a user."""
-        all_equipment = await self.equipment_repository.get_by_user(user_id, active_only=False)
+        stats = await self.equipment_repository.get_statistics(user_id)
+        by_type = stats["by_type"]
 
-        if not all_equipment:
+        if not by_type:
             return {
                 "total_equipment": 0,
                 "active_equipment": 0,
@@ -145,36 +130,15 @@ class EquipmentService:
                 "most_worn_equipment": None
             }
 
-        # Calculate statistics
-        active_count = sum(1 for e in all_equipment if e.active)
-        retired_count = len(all_equipment) - active_count
-
-        # Group by type
-        by_type = defaultdict(int)
-        for equipment in all_equipment:
-            by_type[equipment.type] += 1
-
-        # Find oldest and newest
-        sorted_by_date = sorted(
-            [e for e in all_equipment if e.purchase_date],
-            key=lambda e: e.purchase_date
-        )
-
-        # Find most worn equipment (top 3)
-        sorted_by_wear = sorted(
-            [e for e in all_equipment if e.wear > 0],
-            key=lambda e: e.wear,
-            reverse=True
-        )[:3]
-
-        most_worn = {e.name: e.wear for e in sorted_by_wear} if sorted_by_wear else None
+        total_count = sum(total for total, _ in by_type.values())
+        active_count = sum(active for _, active in by_type.values())
 
         return {
-            "total_equipment": len(all_equipment),
+            "total_equipment": total_count,
             "active_equipment": active_count,
-            "retired_equipment": retired_count,
-            "equipment_by_type": dict(by_type),
-            "oldest_equipment": sorted_by_date[0].name if sorted_by_date else None,
-            "newest_equipment": sorted_by_date[-1].name if sorted_by_date else None,
-            "most_worn_equipment": most_worn
-        }
\ No newline at end of file
+            "retired_equipment": total_count - active_count,
+            "equipment_by_type": {t: total for t, (total, _) in by_type.items()},
+            "oldest_equipment": stats["oldest"],
+            "newest_equipment": stats["newest"],
+            "most_worn_equipment": dict(stats["most_worn"]) or None
+        }
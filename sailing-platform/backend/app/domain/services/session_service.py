@@ -1,5 +1,5 @@
 """Sailing session domain service."""
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from datetime import date
 from uuid import UUID
 from collections import defaultdict
@@ -16,6 +16,26 @@ class SessionService:
     def __init__(self, session_repository: ISessionRepository, equipment_repository: IEquipmentRepository = None):
         self.session_repository = session_repository
         self.equipment_repository = equipment_repository
+        # Equipment already loaded by this (per-request) service instance
+        self._equipment_cache: Dict[UUID, Equipment] = {}
+
+    async def _resolve_equipment(self, equipment_ids: Iterable[UUID]) -> Dict[UUID, Equipment]:
+        """Look up equipment by ID, only querying IDs this service has not seen yet."""
+        cache = self._equipment_cache
+        missing = {eq_id for eq_id in equipment_ids if eq_id not in cache}
+        if missing:
+            cache.update(await self.equipment_repository.get_by_ids(missing))
+        return cache
+
+    async def _validate_equipment(self, user_id: UUID, equipment_ids: List[UUID]) -> None:
+        """Ensure every piece of equipment exists, is owned by the user and is active."""
+        equipment_by_id = await self._resolve_equipment(equipment_ids)
+        for eq_id in equipment_ids:
+            equipment = equipment_by_id.get(eq_id)
+            if not equipment or equipment.owner_id != user_id:
+                raise ValueError(f"Equipment {eq_id} not found or not owned by user")
+            if not equipment.active:
+                raise ValueError(f"Equipment {equipment.name} is retired and cannot be used")
 
     async def create_session(
             self,
@@ -26,12 +46,7 @@ class SessionService:
         # Validate equipment ownership if equipment_ids provided
         equipment_ids = session_data.get('equipment_ids', [])
         if equipment_ids and self.equipment_repository:
-            for eq_id in equipment_ids:
-                equipment = await self.equipment_repository.get_by_id(eq_id)
-                if not equipment or equipment.owner_id != user_id:
-                    raise ValueError(f"Equipment {eq_id} not found or not owned by user")
-                if not equipment.active:
-                    raise ValueError(f"Equipment {equipment.name} is retired and cannot be used")
+            await self._validate_equipment(user_id, equipment_ids)
 
         # Create session entity
         session = SailingSession(
@@ -46,10 +61,11 @@ class SessionService:
             self,
             user_id: UUID,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            after: Optional[Tuple[date, UUID]] = None
     ) -> List[SailingSession]:
-        """Get all sessions for a user."""
-        return await self.session_repository.get_by_user(user_id, skip, limit)
+        """Get a page of a user's sessions, optionally after a (date, id) cursor."""
+        return await self.session_repository.get_by_user(user_id, skip, limit, after)
 
     async def get_session_with_settings(
             self,
@@ -71,12 +87,7 @@ class SessionService:
             user_id: UUID
     ) -> Optional[List[Equipment]]:
         """Get equipment used in a session."""
-        # First check if user owns the session
-        session = await self.session_repository.get_by_id(session_id)
-        if not session or session.created_by != user_id:
-            return None
-
-        return await self.session_repository.get_session_equipment(session_id)
+        return await self.session_repository.get_session_equipment_for_user(session_id, user_id)
 
     async def update_session(
             self,
@@ -93,12 +104,7 @@ class SessionService:
         # Validate new equipment if provided
         equipment_ids = update_data.get('equipment_ids')
         if equipment_ids is not None and self.equipment_repository:
-            for eq_id in equipment_ids:
-                equipment = await self.equipment_repository.get_by_id(eq_id)
-                if not equipment or equipment.owner_id != user_id:
-                    raise ValueError(f"Equipment {eq_id} not found or not owned by user")
-                if not equipment.active:
-                    raise ValueError(f"Equipment {equipment.name} is retired and cannot be used")
+            await self._validate_equipment(user_id, equipment_ids)
 
         # Update session
         session.update(**update_data)
@@ -112,12 +118,7 @@ class SessionService:
             user_id: UUID
     ) -> bool:
         """Delete a session if user owns it."""
-        # Check ownership
-        session = await self.session_repository.get_by_id(session_id)
-        if not session or session.created_by != user_id:
-            return False
-
-        return await self.session_repository.delete(session_id)
+        return await self.session_repository.delete_if_owned(session_id, user_id)
 
     async def create_equipment_settings(
             self,
@@ -126,9 +127,8 @@ class SessionService:
             settings_data: Dict[str, Any]
     ) -> Optional[EquipmentSettings]:
         """Create equipment settings for a session."""
-        # Verify session ownership
-        session = await self.session_repository.get_by_id(session_id)
-        if not session or session.created_by != user_id:
+        # Verify session ownership; only the owner column is needed
+        if await self.session_repository.get_owner_id(session_id) != user_id:
             return None
 
         # Check if settings already exist
@@ -152,15 +152,15 @@ class SessionService:
             end_date: Optional[date] = None
     ) -> Dict[str, Any]:
         """Calculate performance analytics for user sessions."""
-        # Get sessions in date range
-        if start_date and end_date:
-            sessions = await self.session_repository.get_by_date_range(
-                user_id, start_date, end_date
-            )
-        else:
-            sessions = await self.session_repository.get_by_user(user_id)
+        # A range only applies when both ends are given
+        if not (start_date and end_date):
+            start_date = end_date = None
+
+        # Aggregated in the database; analytics does not need the sessions themselves
+        summary = await self.session_repository.get_analytics_summary(user_id, start_date, end_date)
+        by_condition = summary["by_condition"]
 
-        if not sessions:
+        if not by_condition:
             return {
                 "total_sessions": 0,
                 "total_hours": 0,
@@ -170,44 +170,34 @@ class SessionService:
                 "equipment_usage": {}
             }
 
-        # Calculate analytics
-        total_hours = sum(s.hours_on_water for s in sessions)
-        avg_performance = sum(s.performance_rating for s in sessions) / len(sessions)
+        # Overall totals are the sums of the per-condition groups
+        total_sessions = sum(sessions for _, sessions, _, _ in by_condition)
+        total_hours = sum(hours for _, _, hours, _ in by_condition)
+        avg_performance = sum(rating_sum for _, _, _, rating_sum in by_condition) / total_sessions
 
         # Performance by conditions
-        conditions_performance = defaultdict(list)
-        for session in sessions:
-            if session.is_heavy_weather():
-                conditions_performance["heavy"].append(session.performance_rating)
-            elif session.is_light_weather():
-                conditions_performance["light"].append(session.performance_rating)
-            else:
-                conditions_performance["medium"].append(session.performance_rating)
-
         performance_by_conditions = {
-            condition: sum(ratings) / len(ratings) if ratings else 0
-            for condition, ratings in conditions_performance.items()
+            bucket: rating_sum / sessions for bucket, sessions, _, rating_sum in by_condition
         }
-
-        # Sessions by location
-        sessions_by_location = defaultdict(int)
-        for session in sessions:
-            sessions_by_location[session.location] += 1
+        sessions_by_location = dict(summary["by_location"])
 
         # Equipment usage statistics
         equipment_usage = defaultdict(int)
         if self.equipment_repository:
-            for session in sessions:
-                for eq_id in session.equipment_ids:
-                    equipment = await self.equipment_repository.get_by_id(eq_id)
-                    if equipment:
-                        equipment_usage[f"{equipment.name} ({equipment.type})"] += 1
+            usage_counts = await self.session_repository.get_equipment_usage_counts(
+                user_id, start_date, end_date
+            )
+            equipment_by_id = await self._resolve_equipment(usage_counts)
+            for eq_id, count in usage_counts.items():
+                equipment = equipment_by_id.get(eq_id)
+                if equipment:
+                    equipment_usage[f"{equipment.name} ({equipment.type})"] += count
 
         return {
-            "total_sessions": len(sessions),
+            "total_sessions": total_sessions,
             "total_hours": round(total_hours, 1),
             "average_performance": round(avg_performance, 2),
             "performance_by_conditions": performance_by_conditions,
-            "sessions_by_location": dict(sessions_by_location),
+            "sessions_by_location": sessions_by_location,
             "equipment_usage": dict(equipment_usage)
         }
\ No newline at end of file
@@ -1,20 +1,56 @@
 """Database connection setup using async SQLAlchemy."""
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import ORMExecuteState, Session, declarative_base
 
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
+
+# Pool tuning only applies to server databases; SQLite connections are local file handles
+_engine_options = {} if settings.DATABASE_URL.startswith("sqlite") else {
+    "pool_size": settings.DATABASE_POOL_SIZE,
+    "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+    "pool_pre_ping": True,
+    "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+    "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+}
+if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    # Prepared statements are cached per connection, so pooled connections reuse them
+    _engine_options["connect_args"] = {
+        "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE
+    }
 
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
+    echo=settings.DATABASE_ECHO,
+    future=True,
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    **_engine_options
 )
 
+
+class _WriteTrackingSession(Session):
+    """Session that records in ``info["has_writes"]`` whether it wrote anything."""
+
+
+@event.listens_for(_WriteTrackingSession, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(_WriteTrackingSession, "do_orm_execute")
+def _mark_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=_WriteTrackingSession,
     expire_on_commit=False
 )
 
@@ -27,7 +63,9 @@ async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            # Read-only requests skip the commit; closing the session ends their transaction
+            if session.new or session.dirty or session.deleted or session.info.get("has_writes"):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
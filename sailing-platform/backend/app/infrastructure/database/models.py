@@ -2,13 +2,14 @@
 from datetime import datetime, timezone
 from sqlalchemy import (
     Column, String, Boolean, DateTime, Float,
-    Integer, Date, Text, ForeignKey, Enum, Table
+    Integer, Date, Text, ForeignKey, Enum, Table, Index, and_, case, func, or_
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
-import uuid
 import enum
 
+from app.domain.entities.ids import uuid7
 from app.infrastructure.database.connection import Base
 
 
@@ -20,6 +21,10 @@ class WaveTypeEnum(str, enum.Enum):
     LARGE = "Large"
 
 
+_ROUGH_WAVES = (WaveTypeEnum.MEDIUM, WaveTypeEnum.LARGE)
+_CALM_WAVES = (WaveTypeEnum.FLAT, WaveTypeEnum.CHOPPY)
+
+
 class EquipmentTypeEnum(str, enum.Enum):
     MAINSAIL = "Mainsail"
     JIB = "Jib"
@@ -37,19 +42,25 @@ class TensionLevelEnum(str, enum.Enum):
     TIGHT = "Tight"
 
 
+# Native ENUM types on PostgreSQL (4 bytes per value); CHECK-constrained VARCHAR elsewhere
+_ENUM_OPTIONS = {"native_enum": True, "create_constraint": True}
+
+
 # Association table for session equipment (many-to-many)
 session_equipment = Table(
     "session_equipment", Base.metadata,
     Column("session_id", PG_UUID(as_uuid=True), ForeignKey("sessions.id"), primary_key=True),
     Column("equipment_id", PG_UUID(as_uuid=True), ForeignKey("equipment.id"), primary_key=True),
-    Column("created_at", DateTime, default=lambda: datetime.now(timezone.utc))
+    Column("created_at", DateTime, server_default=func.now()),
+    # The primary key leads with session_id; usage counts look rows up by equipment
+    Index("ix_session_equipment_equipment", "equipment_id")
 )
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     username = Column(String(50), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
@@ -63,12 +74,12 @@ class User(Base):
 class Session(Base):
     __tablename__ = "sessions"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
     date = Column(Date, nullable=False, index=True)
     location = Column(String(255), nullable=False)
     wind_speed_min = Column(Float, nullable=False)
     wind_speed_max = Column(Float, nullable=False)
-    wave_type = Column(Enum(WaveTypeEnum), nullable=False)
+    wave_type = Column(Enum(WaveTypeEnum, **_ENUM_OPTIONS), nullable=False)
     wave_direction = Column(String(50), nullable=False)
     hours_on_water = Column(Float, nullable=False)
     performance_rating = Column(Integer, nullable=False)
@@ -96,13 +107,39 @@ class Session(Base):
         lazy="selectin"
     )
 
+    @hybrid_property
+    def condition_bucket(self) -> str:
+        """Weather bucket: "heavy", "light" or "medium", matching the SailingSession checks."""
+        avg_wind = (self.wind_speed_min + self.wind_speed_max) / 2
+        if avg_wind > 20 or self.wave_type in _ROUGH_WAVES:
+            return "heavy"
+        if avg_wind < 8 and self.wave_type in _CALM_WAVES:
+            return "light"
+        return "medium"
+
+    @condition_bucket.inplace.expression
+    @classmethod
+    def _condition_bucket_expression(cls):
+        avg_wind = (cls.wind_speed_min + cls.wind_speed_max) / 2
+        return case(
+            (or_(avg_wind > 20, cls.wave_type.in_(_ROUGH_WAVES)), "heavy"),
+            (and_(avg_wind < 8, cls.wave_type.in_(_CALM_WAVES)), "light"),
+            else_="medium"
+        )
+
+    __table_args__ = (
+        # Per-user listings and date-range analytics filter on created_by and date;
+        # id breaks ties for keyset pagination
+        Index("ix_sessions_created_by_date", "created_by", "date", "id"),
+    )
+
 
 class Equipment(Base):
     __tablename__ = "equipment"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(100), nullable=False)
-    type = Column(Enum(EquipmentTypeEnum), nullable=False)
+    type = Column(Enum(EquipmentTypeEnum, **_ENUM_OPTIONS), nullable=False)
     manufacturer = Column(String(100), nullable=False)
     model = Column(String(100), nullable=False)
     purchase_date = Column(Date, nullable=True)
@@ -123,11 +160,17 @@ class Equipment(Base):
         back_populates="equipment_used"
     )
 
+    __table_args__ = (
+        # get_by_user (active, ordered by name) and get_by_type read rows in index order
+        Index("ix_equipment_owner_active_name", "owner_id", "active", "name"),
+        Index("ix_equipment_owner_type_name", "owner_id", "type", "name"),
+    )
+
 
 class EquipmentSettings(Base):
     __tablename__ = "equipment_settings"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
     session_id = Column(PG_UUID(as_uuid=True), ForeignKey("sessions.id"), unique=True, nullable=False)
 
     # Rig tensions
@@ -144,7 +187,7 @@ class EquipmentSettings(Base):
     pre_bend = Column(Float, nullable=True, default=0.0)
 
     # Sail controls
-    jib_halyard_tension = Column(Enum(TensionLevelEnum), nullable=False)
+    jib_halyard_tension = Column(Enum(TensionLevelEnum, **_ENUM_OPTIONS), nullable=False)
     cunningham = Column(Float, nullable=False)
     outhaul = Column(Float, nullable=False)
     vang = Column(Float, nullable=False)
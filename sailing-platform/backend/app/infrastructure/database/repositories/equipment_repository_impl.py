@@ -1,11 +1,26 @@
-from typing import List, Optional
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
-from sqlalchemy import select, and_
+from sqlalchemy import and_, case, delete, func, insert, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.equipment import Equipment as EquipmentEntity, EquipmentType
 from app.domain.repositories.equipment_repository import IEquipmentRepository
-from app.infrastructure.database.models import Equipment as EquipmentModel
+from app.infrastructure.database.models import (
+    Equipment as EquipmentModel,
+    EquipmentTypeEnum,
+    session_equipment,
+)
+
+# Entity fields in declaration order; model attributes and columns share the names
+_ENTITY_FIELDS = tuple(f.name for f in fields(EquipmentEntity))
+
+# Reads every field off a model in one C-level call, in entity field order
+_model_values = attrgetter(*_ENTITY_FIELDS)
+
+# Columns projected by the list queries, in entity field order
+_ENTITY_COLUMNS = tuple(getattr(EquipmentModel, name) for name in _ENTITY_FIELDS)
 
 
 class EquipmentRepository(IEquipmentRepository):
@@ -16,30 +31,26 @@ class EquipmentRepository(IEquipmentRepository):
 
     def _to_entity(self, model: EquipmentModel) -> EquipmentEntity:
         """Convert database model to domain entity."""
-        # Handle type - it might be an enum or already a string
-        type_value = model.type.value if hasattr(model.type, 'value') else model.type
-
-        return EquipmentEntity(
-            id=model.id,
-            name=model.name,
-            type=type_value,
-            manufacturer=model.manufacturer,
-            model=model.model,
-            purchase_date=model.purchase_date,
-            notes=model.notes,
-            active=model.active,
-            wear=model.wear,
-            owner_id=model.owner_id,
-            created_at=model.created_at,
-            updated_at=model.updated_at
-        )
-
-    def _to_model(self, entity: EquipmentEntity) -> EquipmentModel:
-        """Convert domain entity to database model."""
-        return EquipmentModel(
+        return self._from_row(_model_values(model))
+
+    def _from_row(self, row) -> EquipmentEntity:
+        """Build an entity from values in entity field order."""
+        entity = EquipmentEntity.from_row(row)
+        # Models always hold the enum: loaded rows come back as members and
+        # _to_model converts on the way in
+        entity.type = entity.type.value
+        return entity
+
+    def _rows_to_entities(self, rows) -> List[EquipmentEntity]:
+        """Convert projected column rows to domain entities without building ORM models."""
+        return [self._from_row(row) for row in rows]
+
+    def _to_values(self, entity: EquipmentEntity) -> Dict[str, Any]:
+        """Convert domain entity to column values."""
+        return dict(
             id=entity.id,
             name=entity.name,
-            type=entity.type,
+            type=EquipmentTypeEnum(entity.type),
             manufacturer=entity.manufacturer,
             model=entity.model,
             purchase_date=entity.purchase_date,
@@ -51,78 +62,108 @@ class EquipmentRepository(IEquipmentRepository):
             updated_at=entity.updated_at
         )
 
+    def _to_model(self, entity: EquipmentEntity) -> EquipmentModel:
+        """Convert domain entity to database model."""
+        return EquipmentModel(**self._to_values(entity))
+
     async def create(self, entity: EquipmentEntity) -> EquipmentEntity:
         """Create new equipment."""
         model = self._to_model(entity)
         self.session.add(model)
         await self.session.flush()
-        await self.session.refresh(model)
         return self._to_entity(model)
 
+    async def create_many(self, entities: List[EquipmentEntity]) -> List[EquipmentEntity]:
+        """Create several pieces of equipment with a single batched INSERT."""
+        if not entities:
+            return []
+        # Every column is supplied by the entities, so nothing needs to be read back
+        await self.session.execute(insert(EquipmentModel), [self._to_values(e) for e in entities])
+        return list(entities)
+
     async def get_by_id(self, entity_id: UUID) -> Optional[EquipmentEntity]:
         """Get equipment by ID."""
-        stmt = select(EquipmentModel).where(EquipmentModel.id == entity_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        # Primary-key lookup: served from the identity map when already loaded
+        model = await self.session.get(EquipmentModel, entity_id)
         return self._to_entity(model) if model else None
 
+    async def get_by_ids(self, equipment_ids: Iterable[UUID]) -> Dict[UUID, EquipmentEntity]:
+        """Get several pieces of equipment in one query, keyed by ID."""
+        ids = set(equipment_ids)
+        if not ids:
+            return {}
+        stmt = select(EquipmentModel).where(EquipmentModel.id.in_(ids))
+        result = await self.session.execute(stmt)
+        return {model.id: self._to_entity(model) for model in result.scalars()}
+
     async def update(self, entity: EquipmentEntity) -> EquipmentEntity:
         """Update existing equipment."""
-        stmt = select(EquipmentModel).where(EquipmentModel.id == entity.id)
+        # Single UPDATE ... RETURNING; no prior SELECT
+        stmt = (
+            update(EquipmentModel)
+            .where(EquipmentModel.id == entity.id)
+            .values(
+                name=entity.name,
+                type=EquipmentTypeEnum(entity.type),
+                manufacturer=entity.manufacturer,
+                model=entity.model,
+                purchase_date=entity.purchase_date,
+                notes=entity.notes,
+                active=entity.active,
+                wear=entity.wear,
+                updated_at=entity.updated_at
+            )
+            .returning(EquipmentModel)
+        )
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
 
         if not model:
             raise ValueError("Equipment not found")
-
-        model.name = entity.name
-        model.type = entity.type
-        model.manufacturer = entity.manufacturer
-        model.model = entity.model
-        model.purchase_date = entity.purchase_date
-        model.notes = entity.notes
-        model.active = entity.active
-        model.wear = entity.wear
-        model.updated_at = entity.updated_at
-
-        await self.session.flush()
-        await self.session.refresh(model)
         return self._to_entity(model)
 
     async def delete(self, entity_id: UUID) -> bool:
         """Delete equipment by ID."""
-        stmt = select(EquipmentModel).where(EquipmentModel.id == entity_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        return await self._delete_where(EquipmentModel.id == entity_id)
 
-        if not model:
-            return False
+    async def delete_if_owned(self, equipment_id: UUID, owner_id: UUID) -> bool:
+        """Delete equipment only if it belongs to ``owner_id``."""
+        return await self._delete_where(
+            EquipmentModel.id == equipment_id,
+            EquipmentModel.owner_id == owner_id
+        )
 
-        await self.session.delete(model)
-        await self.session.flush()
-        return True
+    async def _delete_where(self, *conditions) -> bool:
+        # Unlink from sessions first; there is no ON DELETE CASCADE on the association table
+        await self.session.execute(
+            delete(session_equipment).where(
+                session_equipment.c.equipment_id.in_(select(EquipmentModel.id).where(*conditions))
+            )
+        )
+        result = await self.session.execute(delete(EquipmentModel).where(*conditions))
+        return result.rowcount > 0
 
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[EquipmentEntity]:
         """List all equipment with pagination."""
-        stmt = select(EquipmentModel).offset(skip).limit(limit).order_by(EquipmentModel.created_at.desc())
+        stmt = lambda_stmt(lambda: (
+            select(*_ENTITY_COLUMNS).offset(skip).limit(limit).order_by(EquipmentModel.created_at.desc())
+        ))
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_entity(m) for m in models]
+        return self._rows_to_entities(result)
 
     async def get_by_user(self, user_id: UUID, active_only: bool = True) -> List[EquipmentEntity]:
         """Get all equipment for a specific user."""
-        conditions = [EquipmentModel.owner_id == user_id]
+        stmt = lambda_stmt(lambda: select(*_ENTITY_COLUMNS).where(EquipmentModel.owner_id == user_id))
         if active_only:
-            conditions.append(EquipmentModel.active == True)
-
-        stmt = select(EquipmentModel).where(and_(*conditions)).order_by(EquipmentModel.name)
+            stmt += lambda s: s.where(EquipmentModel.active.is_(True))
+        stmt += lambda s: s.order_by(EquipmentModel.name)
         result = await self.session.execute(stmt)
-        return [self._to_entity(m) for m in result.scalars().all()]
+        return self._rows_to_entities(result)
 
     async def get_by_type(self, user_id: UUID, equipment_type: EquipmentType) -> List[EquipmentEntity]:
         """Get equipment by type for a user."""
-        stmt = (
-            select(EquipmentModel)
+        stmt = lambda_stmt(lambda: (
+            select(*_ENTITY_COLUMNS)
             .where(
                 and_(
                     EquipmentModel.owner_id == user_id,
@@ -130,32 +171,79 @@ class EquipmentRepository(IEquipmentRepository):
                 )
             )
             .order_by(EquipmentModel.name)
-        )
+        ))
         result = await self.session.execute(stmt)
-        return [self._to_entity(m) for m in result.scalars().all()]
+        return self._rows_to_entities(result)
 
     async def retire(self, equipment_id: UUID) -> bool:
         """Retire equipment by ID."""
-        stmt = select(EquipmentModel).where(EquipmentModel.id == equipment_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-
-        if not model:
-            return False
-
-        model.active = False
-        await self.session.flush()
-        return True
+        return await self._set_active_where(False, EquipmentModel.id == equipment_id)
 
     async def reactivate(self, equipment_id: UUID) -> bool:
         """Reactivate retired equipment."""
-        stmt = select(EquipmentModel).where(EquipmentModel.id == equipment_id)
+        return await self._set_active_where(True, EquipmentModel.id == equipment_id)
+
+    async def retire_if_owned(self, equipment_id: UUID, owner_id: UUID) -> bool:
+        """Retire equipment only if it belongs to ``owner_id``."""
+        return await self._set_active_where(
+            False, EquipmentModel.id == equipment_id, EquipmentModel.owner_id == owner_id
+        )
+
+    async def reactivate_if_owned(self, equipment_id: UUID, owner_id: UUID) -> bool:
+        """Reactivate equipment only if it belongs to ``owner_id``."""
+        return await self._set_active_where(
+            True, EquipmentModel.id == equipment_id, EquipmentModel.owner_id == owner_id
+        )
+
+    async def _set_active_where(self, active: bool, *conditions) -> bool:
+        stmt = update(EquipmentModel).where(*conditions).values(active=active)
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        return result.rowcount > 0
 
-        if not model:
-            return False
+    async def get_statistics(self, user_id: UUID) -> Dict[str, Any]:
+        """Get aggregate equipment figures for a user."""
+        owned = EquipmentModel.owner_id == user_id
 
-        model.active = True
-        await self.session.flush()
-        return True
\ No newline at end of file
+        # Counts per type
+        stmt = (
+            select(
+                EquipmentModel.type,
+                func.count(),
+                func.sum(case((EquipmentModel.active.is_(True), 1), else_=0))
+            )
+            .where(owned)
+            .group_by(EquipmentModel.type)
+        )
+        result = await self.session.execute(stmt)
+        by_type = {
+            t.value: (total, active)
+            for t, total, active in result
+        }
+
+        # Oldest and newest purchases (ties broken by name)
+        dated = and_(owned, EquipmentModel.purchase_date.is_not(None))
+        oldest = await self.session.scalar(
+            select(EquipmentModel.name).where(dated)
+            .order_by(EquipmentModel.purchase_date, EquipmentModel.name).limit(1)
+        )
+        newest = await self.session.scalar(
+            select(EquipmentModel.name).where(dated)
+            .order_by(EquipmentModel.purchase_date.desc(), EquipmentModel.name.desc()).limit(1)
+        )
+
+        # Most worn
+        stmt = (
+            select(EquipmentModel.name, EquipmentModel.wear)
+            .where(and_(owned, EquipmentModel.wear > 0))
+            .order_by(EquipmentModel.wear.desc(), EquipmentModel.name)
+            .limit(3)
+        )
+        result = await self.session.execute(stmt)
+        most_worn = [(name, wear) for name, wear in result]
+
+        return {
+            "by_type": by_type,
+            "oldest": oldest,
+            "newest": newest,
+            "most_worn": most_worn
+        }
@@ -1,8 +1,10 @@
-from typing import Optional, List, Tuple
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, List, Tuple
 from datetime import date
 from uuid import UUID
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, case, func, lambda_stmt, or_, update
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.session import SailingSession as SessionEntity
@@ -11,9 +13,36 @@ from app.infrastructure.database.models import (
     Session as SessionModel,
     Equipment as EquipmentModel,
     EquipmentSettings as SettingsModel,
+    TensionLevelEnum,
+    WaveTypeEnum,
+    session_equipment,
 )
 from app.domain.repositories.session_repository import ISessionRepository
 
+# Session columns projected by the list queries; equipment_ids are filled in separately
+_LIST_COLUMNS = (
+    SessionModel.id,
+    SessionModel.date,
+    SessionModel.location,
+    SessionModel.wind_speed_min,
+    SessionModel.wind_speed_max,
+    SessionModel.wave_type,
+    SessionModel.wave_direction,
+    SessionModel.hours_on_water,
+    SessionModel.performance_rating,
+    SessionModel.notes,
+    SessionModel.created_by,
+    SessionModel.created_at,
+    SessionModel.updated_at,
+)
+
+# Loader options for single-session reads: equipment is loaded eagerly and any other
+# relationship access raises instead of silently issuing a lazy SELECT
+_EQUIPMENT_ONLY = [selectinload(SessionModel.equipment_used), raiseload("*")]
+
+# Session IDs per IN clause when fetching equipment IDs for a listing
+_EQUIPMENT_ID_BATCH = 500
+
 
 class SessionRepository(ISessionRepository):
     """Session repository implementation with equipment tracking."""
@@ -23,26 +52,65 @@ class SessionRepository(ISessionRepository):
 
     def _to_entity(self, m: SessionModel) -> SessionEntity:
         """Convert database model to domain entity."""
-        # Handle wave_type - it might be an enum or already a string
-        wave_type_value = m.wave_type.value if hasattr(m.wave_type, 'value') else m.wave_type
-
-        return SessionEntity(
+        return SessionEntity.from_trusted(
             id=m.id,
             date=m.date,
             location=m.location,
             wind_speed_min=m.wind_speed_min,
             wind_speed_max=m.wind_speed_max,
-            wave_type=wave_type_value,
+            wave_type=m.wave_type.value,
             wave_direction=m.wave_direction,
             hours_on_water=m.hours_on_water,
             performance_rating=m.performance_rating,
             notes=m.notes,
-            equipment_ids=[eq.id for eq in m.equipment_used] if hasattr(m, 'equipment_used') else [],
+            equipment_ids=[eq.id for eq in m.equipment_used],
             created_by=m.created_by,
             created_at=m.created_at,
             updated_at=m.updated_at,
         )
 
+    async def _rows_to_entities(self, result) -> List[SessionEntity]:
+        """Build entities from projected session rows.
+
+        Equipment IDs are read straight from the association table instead of
+        eager-loading full equipment models for every session.
+        """
+        rows = result.all()
+        session_ids = [row.id for row in rows]
+        equipment_ids = defaultdict(list)
+        for start in range(0, len(session_ids), _EQUIPMENT_ID_BATCH):
+            pairs = await self.session.execute(
+                select(session_equipment.c.session_id, session_equipment.c.equipment_id)
+                .where(session_equipment.c.session_id.in_(session_ids[start:start + _EQUIPMENT_ID_BATCH]))
+            )
+            for session_id, equipment_id in pairs:
+                equipment_ids[session_id].append(equipment_id)
+
+        entities = []
+        for row in rows:
+            values = row._asdict()
+            values["wave_type"] = values["wave_type"].value
+            values["equipment_ids"] = equipment_ids.get(row.id, [])
+            entities.append(SessionEntity.from_trusted(**values))
+        return entities
+
+    def _equipment_to_entity(self, eq: EquipmentModel) -> EquipmentEntity:
+        """Convert an equipment model to a domain entity."""
+        return EquipmentEntity.from_trusted(
+            id=eq.id,
+            name=eq.name,
+            type=eq.type.value,
+            manufacturer=eq.manufacturer,
+            model=eq.model,
+            purchase_date=eq.purchase_date,
+            notes=eq.notes,
+            active=eq.active,
+            wear=eq.wear,
+            owner_id=eq.owner_id,
+            created_at=eq.created_at,
+            updated_at=eq.updated_at
+        )
+
     async def _to_model(self, e: SessionEntity) -> SessionModel:
         """Convert domain entity to database model."""
         model = SessionModel(
@@ -51,7 +119,7 @@ class SessionRepository(ISessionRepository):
             location=e.location,
             wind_speed_min=e.wind_speed_min,
             wind_speed_max=e.wind_speed_max,
-            wave_type=e.wave_type,
+            wave_type=WaveTypeEnum(e.wave_type),
             wave_direction=e.wave_direction,
             hours_on_water=e.hours_on_water,
             performance_rating=e.performance_rating,
@@ -61,68 +129,84 @@ class SessionRepository(ISessionRepository):
             updated_at=e.updated_at,
         )
 
-        # Load equipment if IDs provided
-        if e.equipment_ids:
-            stmt = select(EquipmentModel).where(EquipmentModel.id.in_(e.equipment_ids))
-            result = await self.session.execute(stmt)
-            model.equipment_used = list(result.scalars().all())
-
+        model.equipment_used = await self._load_equipment(e.equipment_ids)
         return model
 
+    async def _load_equipment(self, equipment_ids: Iterable[UUID]) -> List[EquipmentModel]:
+        """Load equipment models, reusing rows already in the session's identity map.
+
+        Equipment validated earlier in the same request is already loaded, so usually
+        no SELECT is needed; unknown IDs are skipped.
+        """
+        ids = list(dict.fromkeys(equipment_ids))
+        identity_map = self.session.identity_map
+        loaded = {}
+        for eq_id in ids:
+            model = identity_map.get(identity_key(EquipmentModel, eq_id))
+            if model is not None:
+                loaded[eq_id] = model
+
+        missing = [eq_id for eq_id in ids if eq_id not in loaded]
+        if missing:
+            result = await self.session.execute(
+                select(EquipmentModel).where(EquipmentModel.id.in_(missing))
+            )
+            loaded.update((eq.id, eq) for eq in result.scalars())
+
+        return [loaded[eq_id] for eq_id in ids if eq_id in loaded]
+
+    async def _adjust_wear(self, equipment_ids: Iterable[UUID], hours: float) -> None:
+        """Add ``hours`` (negative to subtract) to the wear of several pieces of equipment.
+
+        Done in a single UPDATE; wear never drops below zero.
+        """
+        ids = list(equipment_ids)
+        if not ids or not hours:
+            return
+        new_wear = EquipmentModel.wear + hours
+        await self.session.execute(
+            update(EquipmentModel)
+            .where(EquipmentModel.id.in_(ids))
+            .values(wear=case((new_wear > 0, new_wear), else_=0.0))
+        )
+
     async def create(self, entity: SessionEntity) -> SessionEntity:
         """Create a new session."""
         model = await self._to_model(entity)
         self.session.add(model)
         await self.session.flush()
 
-        # Reload with relationships
-        stmt = (
-            select(SessionModel)
-            .options(selectinload(SessionModel.equipment_used))
-            .where(SessionModel.id == model.id)
-        )
-        result = await self.session.execute(stmt)
-        model = result.scalar_one()
-
         # Add wear to equipment
-        for equipment in model.equipment_used:
-            equipment.wear += entity.hours_on_water
-
-        await self.session.flush()
+        await self._adjust_wear([eq.id for eq in model.equipment_used], entity.hours_on_water)
         return self._to_entity(model)
 
     async def get_by_id(self, entity_id: UUID) -> Optional[SessionEntity]:
         """Get session by ID."""
-        stmt = (
-            select(SessionModel)
-            .options(selectinload(SessionModel.equipment_used))
-            .where(SessionModel.id == entity_id)
+        # Primary-key lookup: served from the identity map when already loaded
+        m = await self.session.get(
+            SessionModel, entity_id, options=_EQUIPMENT_ONLY
         )
-        res = await self.session.execute(stmt)
-        m = res.scalar_one_or_none()
         return self._to_entity(m) if m else None
 
     async def update(self, entity: SessionEntity) -> SessionEntity:
         """Update an existing session."""
-        stmt = (
-            select(SessionModel)
-            .options(selectinload(SessionModel.equipment_used))
-            .where(SessionModel.id == entity.id)
+        # Usually already in the identity map from the ownership check, so no SELECT is emitted
+        m = await self.session.get(
+            SessionModel, entity.id, options=_EQUIPMENT_ONLY
         )
-        res = await self.session.execute(stmt)
-        m = res.scalar_one_or_none()
         if not m:
             raise ValueError("Session not found")
 
         # Calculate wear difference if hours changed
-        hours_diff = entity.hours_on_water - m.hours_on_water
+        old_hours = m.hours_on_water
+        hours_diff = entity.hours_on_water - old_hours
 
         # Update basic fields
         m.date = entity.date
         m.location = entity.location
         m.wind_speed_min = entity.wind_speed_min
         m.wind_speed_max = entity.wind_speed_max
-        m.wave_type = entity.wave_type
+        m.wave_type = WaveTypeEnum(entity.wave_type)
         m.wave_direction = entity.wave_direction
         m.hours_on_water = entity.hours_on_water
         m.performance_rating = entity.performance_rating
@@ -131,48 +215,46 @@ class SessionRepository(ISessionRepository):
 
         # Update equipment if changed
         if entity.equipment_ids is not None:
-            # Update wear for removed equipment (subtract hours)
             old_equipment_ids = {eq.id for eq in m.equipment_used}
             new_equipment_ids = set(entity.equipment_ids)
 
-            removed_ids = old_equipment_ids - new_equipment_ids
-            for eq in m.equipment_used:
-                if eq.id in removed_ids:
-                    eq.wear = max(0, eq.wear - m.hours_on_water)
-
             # Update equipment list
-            stmt = select(EquipmentModel).where(EquipmentModel.id.in_(entity.equipment_ids))
-            result = await self.session.execute(stmt)
-            m.equipment_used = list(result.scalars().all())
-
-            # Add wear to new equipment
-            added_ids = new_equipment_ids - old_equipment_ids
-            for eq in m.equipment_used:
-                if eq.id in added_ids:
-                    eq.wear += entity.hours_on_water
-                elif hours_diff != 0:
-                    # Adjust wear for existing equipment if hours changed
-                    eq.wear += hours_diff
+            if new_equipment_ids != old_equipment_ids:
+                m.equipment_used = await self._load_equipment(entity.equipment_ids)
+
+            # Removed equipment gives back the old hours, added equipment gains the new
+            # hours and equipment kept on the session absorbs the difference
+            await self._adjust_wear(old_equipment_ids - new_equipment_ids, -old_hours)
+            await self._adjust_wear(new_equipment_ids - old_equipment_ids, entity.hours_on_water)
+            await self._adjust_wear(old_equipment_ids & new_equipment_ids, hours_diff)
 
+        # Every column was just assigned, so no refresh is needed
         await self.session.flush()
-        await self.session.refresh(m)
         return self._to_entity(m)
 
     async def delete(self, entity_id: UUID) -> bool:
         """Delete a session by ID."""
-        stmt = (
-            select(SessionModel)
-            .options(selectinload(SessionModel.equipment_used))
-            .where(SessionModel.id == entity_id)
+        return await self._delete(entity_id)
+
+    async def get_owner_id(self, session_id: UUID) -> Optional[UUID]:
+        """Get the ID of the user who created a session."""
+        return await self.session.scalar(
+            select(SessionModel.created_by).where(SessionModel.id == session_id)
         )
-        res = await self.session.execute(stmt)
-        m = res.scalar_one_or_none()
-        if not m:
+
+    async def delete_if_owned(self, session_id: UUID, user_id: UUID) -> bool:
+        """Delete a session only if it was created by ``user_id``."""
+        return await self._delete(session_id, owner_id=user_id)
+
+    async def _delete(self, session_id: UUID, owner_id: Optional[UUID] = None) -> bool:
+        m = await self.session.get(
+            SessionModel, session_id, options=_EQUIPMENT_ONLY
+        )
+        if not m or (owner_id is not None and m.created_by != owner_id):
             return False
 
         # Subtract wear from equipment
-        for eq in m.equipment_used:
-            eq.wear = max(0, eq.wear - m.hours_on_water)
+        await self._adjust_wear([eq.id for eq in m.equipment_used], -m.hours_on_water)
 
         await self.session.delete(m)
         await self.session.flush()
@@ -180,34 +262,41 @@ class SessionRepository(ISessionRepository):
 
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[SessionEntity]:
         """List all sessions with pagination."""
-        stmt = (
-            select(SessionModel)
-            .options(selectinload(SessionModel.equipment_used))
+        stmt = lambda_stmt(lambda: (
+            select(*_LIST_COLUMNS)
             .offset(skip)
             .limit(limit)
             .order_by(SessionModel.date.desc())
-        )
-        res = await self.session.execute(stmt)
-        return [self._to_entity(x) for x in res.scalars().all()]
-
-    async def get_by_user(self, user_id: UUID, skip: int = 0, limit: int = 100) -> List[SessionEntity]:
-        """Get all sessions for a specific user."""
-        stmt = (
-            select(SessionModel)
-            .options(selectinload(SessionModel.equipment_used))
-            .where(SessionModel.created_by == user_id)
+        ))
+        return await self._rows_to_entities(await self.session.execute(stmt))
+
+    async def get_by_user(
+            self,
+            user_id: UUID,
+            skip: int = 0,
+            limit: int = 100,
+            after: Optional[Tuple[date, UUID]] = None
+    ) -> List[SessionEntity]:
+        """Get a user's sessions, newest first, optionally continuing after a (date, id) cursor."""
+        stmt = lambda_stmt(lambda: select(*_LIST_COLUMNS).where(SessionModel.created_by == user_id))
+        if after is not None:
+            # Seek past the cursor on the (created_by, date, id) index instead of counting rows off
+            after_date, after_id = after
+            stmt += lambda s: s.where(or_(
+                SessionModel.date < after_date,
+                and_(SessionModel.date == after_date, SessionModel.id < after_id)
+            ))
+        stmt += lambda s: (
+            s.order_by(SessionModel.date.desc(), SessionModel.id.desc())
             .offset(skip)
             .limit(limit)
-            .order_by(SessionModel.date.desc())
         )
-        res = await self.session.execute(stmt)
-        return [self._to_entity(x) for x in res.scalars().all()]
+        return await self._rows_to_entities(await self.session.execute(stmt))
 
     async def get_by_date_range(self, user_id: UUID, start_date: date, end_date: date) -> List[SessionEntity]:
         """Get sessions within a date range for a user."""
-        stmt = (
-            select(SessionModel)
-            .options(selectinload(SessionModel.equipment_used))
+        stmt = lambda_stmt(lambda: (
+            select(*_LIST_COLUMNS)
             .where(
                 and_(
                     SessionModel.created_by == user_id,
@@ -216,22 +305,24 @@ class SessionRepository(ISessionRepository):
                 )
             )
             .order_by(SessionModel.date.desc())
-        )
-        res = await self.session.execute(stmt)
-        return [self._to_entity(x) for x in res.scalars().all()]
+        ))
+        return await self._rows_to_entities(await self.session.execute(stmt))
 
     async def get_with_settings(self, session_id: UUID) -> Optional[Tuple[SessionEntity, Optional[SettingsEntity]]]:
         """Get session with its equipment settings."""
         stmt = (
             select(SessionModel)
             .options(
-                selectinload(SessionModel.equipment_settings),
-                selectinload(SessionModel.equipment_used)
+                # A single session has only a handful of equipment rows, so join both
+                # relationships into one SELECT instead of follow-up queries
+                joinedload(SessionModel.equipment_settings),
+                joinedload(SessionModel.equipment_used),
+                raiseload("*")
             )
             .where(SessionModel.id == session_id)
         )
         res = await self.session.execute(stmt)
-        m = res.scalar_one_or_none()
+        m = res.unique().scalar_one_or_none()
         if not m:
             return None
         return self._to_entity(m), self._settings_to_entity(m.equipment_settings) if m.equipment_settings else None
@@ -240,7 +331,7 @@ class SessionRepository(ISessionRepository):
         """Get all equipment used in a session."""
         stmt = (
             select(SessionModel)
-            .options(selectinload(SessionModel.equipment_used))
+            .options(*_EQUIPMENT_ONLY)
             .where(SessionModel.id == session_id)
         )
         res = await self.session.execute(stmt)
@@ -248,59 +339,60 @@ class SessionRepository(ISessionRepository):
         if not m:
             return []
 
-        # Convert equipment models to entities
-        equipment_entities = []
-        for eq in m.equipment_used:
-            equipment_entities.append(EquipmentEntity(
-                id=eq.id,
-                name=eq.name,
-                type=eq.type.value,
-                manufacturer=eq.manufacturer,
-                model=eq.model,
-                purchase_date=eq.purchase_date,
-                notes=eq.notes,
-                active=eq.active,
-                wear=eq.wear,
-                owner_id=eq.owner_id,
-                created_at=eq.created_at,
-                updated_at=eq.updated_at
-            ))
+        return [self._equipment_to_entity(eq) for eq in m.equipment_used]
 
-        return equipment_entities
+    async def get_session_equipment_for_user(
+            self,
+            session_id: UUID,
+            user_id: UUID
+    ) -> Optional[List[EquipmentEntity]]:
+        """Get the equipment used in a session, or ``None`` if the user does not own it."""
+        # Outer joins keep a row for an owned session without equipment
+        stmt = (
+            select(SessionModel.id, EquipmentModel)
+            .outerjoin(session_equipment, session_equipment.c.session_id == SessionModel.id)
+            .outerjoin(EquipmentModel, EquipmentModel.id == session_equipment.c.equipment_id)
+            .where(and_(SessionModel.id == session_id, SessionModel.created_by == user_id))
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if not rows:
+            return None
+        return [self._equipment_to_entity(eq) for _, eq in rows if eq is not None]
 
     async def create_settings(self, settings: SettingsEntity) -> SettingsEntity:
         """Create equipment settings for a session."""
         m = self._settings_to_model(settings)
         self.session.add(m)
         await self.session.flush()
-        await self.session.refresh(m)
         return self._settings_to_entity(m)
 
     async def update_settings(self, settings: SettingsEntity) -> SettingsEntity:
         """Update equipment settings for a session."""
-        stmt = select(SettingsModel).where(SettingsModel.id == settings.id)
+        # Single UPDATE ... RETURNING; no prior SELECT
+        stmt = (
+            update(SettingsModel)
+            .where(SettingsModel.id == settings.id)
+            .values(
+                forestay_tension=settings.forestay_tension,
+                shroud_tension=settings.shroud_tension,
+                mast_rake=settings.mast_rake,
+                main_tension=settings.main_tension,
+                cap_tension=settings.cap_tension,
+                cap_hole=settings.cap_hole,
+                lowers_scale=settings.lowers_scale,
+                mains_scale=settings.mains_scale,
+                pre_bend=settings.pre_bend,
+                jib_halyard_tension=TensionLevelEnum(settings.jib_halyard_tension),
+                cunningham=settings.cunningham,
+                outhaul=settings.outhaul,
+                vang=settings.vang
+            )
+            .returning(SettingsModel)
+        )
         res = await self.session.execute(stmt)
         m = res.scalar_one_or_none()
         if not m:
             raise ValueError("Equipment settings not found")
-
-        # Update all fields
-        m.forestay_tension = settings.forestay_tension
-        m.shroud_tension = settings.shroud_tension
-        m.mast_rake = settings.mast_rake
-        m.main_tension = settings.main_tension
-        m.cap_tension = settings.cap_tension
-        m.cap_hole = settings.cap_hole
-        m.lowers_scale = settings.lowers_scale
-        m.mains_scale = settings.mains_scale
-        m.pre_bend = settings.pre_bend
-        m.jib_halyard_tension = settings.jib_halyard_tension
-        m.cunningham = settings.cunningham
-        m.outhaul = settings.outhaul
-        m.vang = settings.vang
-
-        await self.session.flush()
-        await self.session.refresh(m)
         return self._settings_to_entity(m)
 
     async def get_settings_by_session(self, session_id: UUID) -> Optional[SettingsEntity]:
@@ -315,17 +407,13 @@ class SessionRepository(ISessionRepository):
         if not m:
             return None
 
-        # Handle jib_halyard_tension - it might be an enum or already a string
-        jib_tension_value = m.jib_halyard_tension.value if hasattr(m.jib_halyard_tension,
-                                                                   'value') else m.jib_halyard_tension
-
-        return SettingsEntity(
+        return SettingsEntity.from_trusted(
             id=m.id,
             session_id=m.session_id,
             forestay_tension=m.forestay_tension,
             shroud_tension=m.shroud_tension,
             mast_rake=m.mast_rake,
-            jib_halyard_tension=jib_tension_value,
+            jib_halyard_tension=m.jib_halyard_tension.value,
             cunningham=m.cunningham,
             outhaul=m.outhaul,
             vang=m.vang,
@@ -346,7 +434,7 @@ class SessionRepository(ISessionRepository):
             forestay_tension=e.forestay_tension,
             shroud_tension=e.shroud_tension,
             mast_rake=e.mast_rake,
-            jib_halyard_tension=e.jib_halyard_tension,
+            jib_halyard_tension=TensionLevelEnum(e.jib_halyard_tension),
             cunningham=e.cunningham,
             outhaul=e.outhaul,
             vang=e.vang,
@@ -357,4 +445,65 @@ class SessionRepository(ISessionRepository):
             mains_scale=e.mains_scale,
             pre_bend=e.pre_bend,
             created_at=e.created_at
-        )
\ No newline at end of file
+        )
+
+    def _user_sessions_filter(self, user_id: UUID, start_date: Optional[date], end_date: Optional[date]):
+        conditions = [SessionModel.created_by == user_id]
+        if start_date is not None:
+            conditions.append(SessionModel.date >= start_date)
+        if end_date is not None:
+            conditions.append(SessionModel.date <= end_date)
+        return and_(*conditions)
+
+    async def get_analytics_summary(
+            self,
+            user_id: UUID,
+            start_date: Optional[date] = None,
+            end_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """Aggregate a user's sessions per condition bucket and per location."""
+        user_sessions = self._user_sessions_filter(user_id, start_date, end_date)
+        # Groups are ordered by their most recent session
+        latest = func.max(SessionModel.date).desc()
+
+        bucket = SessionModel.condition_bucket.label("bucket")
+        stmt = (
+            select(
+                bucket,
+                func.count(),
+                func.sum(SessionModel.hours_on_water),
+                func.sum(SessionModel.performance_rating)
+            )
+            .where(user_sessions)
+            .group_by(bucket)
+            .order_by(latest, bucket)
+        )
+        res = await self.session.execute(stmt)
+        by_condition = list(res.tuples())
+
+        stmt = (
+            select(SessionModel.location, func.count())
+            .where(user_sessions)
+            .group_by(SessionModel.location)
+            .order_by(latest, SessionModel.location)
+        )
+        res = await self.session.execute(stmt)
+        by_location = list(res.tuples())
+
+        return {"by_condition": by_condition, "by_location": by_location}
+
+    async def get_equipment_usage_counts(
+            self,
+            user_id: UUID,
+            start_date: Optional[date] = None,
+            end_date: Optional[date] = None
+    ) -> Dict[UUID, int]:
+        """Count the user's sessions per equipment ID."""
+        stmt = (
+            select(session_equipment.c.equipment_id, func.count())
+            .join(SessionModel, SessionModel.id == session_equipment.c.session_id)
+            .where(self._user_sessions_filter(user_id, start_date, end_date))
+            .group_by(session_equipment.c.equipment_id)
+        )
+        res = await self.session.execute(stmt)
+        return {equipment_id: count for equipment_id, count in res}
@@ -1,14 +1,24 @@
 """User repository implementation using SQLAlchemy."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import exists, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User as UserEntity
 from app.domain.repositories.user_repository import IUserRepository
+from app.infrastructure.cache import TTLCache
 from app.infrastructure.database.models import User as UserModel
 
 
+# Short-lived, process-wide memory of email/username lookups that found nothing.
+# Only misses are remembered, so a cached answer can at worst be "free" for a
+# value another worker has just taken; the unique constraints still guard the
+# insert, and their violations are reported like the checks'. Writes through
+# this process drop the affected keys.
+_missing_users: TTLCache[Tuple[str, str], bool] = TTLCache(ttl=5.0, maxsize=4096)
+
+
 class UserRepository(IUserRepository):
     """User repository implementation."""
 
@@ -17,7 +27,7 @@ class UserRepository(IUserRepository):
 
     def _to_entity(self, model: UserModel) -> UserEntity:
         """Convert database model to domain entity."""
-        return UserEntity(
+        return UserEntity.from_trusted(
             id=model.id,
             email=model.email,
             username=model.username,
@@ -37,24 +47,38 @@ class UserRepository(IUserRepository):
             created_at=entity.created_at
         )
 
+    def _forget_missing(self, entity: UserEntity) -> None:
+        _missing_users.discard(("email", entity.email))
+        _missing_users.discard(("username", entity.username))
+
+    def _conflict_error(self, entity: UserEntity, error: IntegrityError) -> ValueError:
+        """Translate a unique-constraint violation into the registration error messages."""
+        # A concurrent write can slip past the existence checks (or a stale cached miss)
+        self._forget_missing(entity)
+        if "username" in str(error.orig):
+            return ValueError("Username already taken")
+        return ValueError("Email already registered")
+
     async def create(self, entity: UserEntity) -> UserEntity:
         """Create a new user."""
+        self._forget_missing(entity)
         model = self._to_model(entity)
         self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
+        try:
+            await self.session.flush()
+        except IntegrityError as e:
+            raise self._conflict_error(entity, e) from e
         return self._to_entity(model)
 
     async def get_by_id(self, entity_id: UUID) -> Optional[UserEntity]:
         """Get user by ID."""
-        stmt = select(UserModel).where(UserModel.id == entity_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        # Primary-key lookup: served from the identity map when already loaded
+        model = await self.session.get(UserModel, entity_id)
         return self._to_entity(model) if model else None
 
     async def get_by_email(self, email: str) -> Optional[UserEntity]:
         """Get user by email."""
-        stmt = select(UserModel).where(UserModel.email == email)
+        stmt = lambda_stmt(lambda: select(UserModel).where(UserModel.email == email))
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
@@ -68,29 +92,32 @@ class UserRepository(IUserRepository):
 
     async def update(self, entity: UserEntity) -> UserEntity:
         """Update an existing user."""
-        stmt = select(UserModel).where(UserModel.id == entity.id)
-        result = await self.session.execute(stmt)
+        # Single UPDATE ... RETURNING; no prior SELECT
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == entity.id)
+            .values(
+                email=entity.email,
+                username=entity.username,
+                hashed_password=entity.hashed_password,
+                is_active=entity.is_active
+            )
+            .returning(UserModel)
+        )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
+            raise self._conflict_error(entity, e) from e
         model = result.scalar_one_or_none()
 
         if not model:
             raise ValueError("User not found")
-
-        # Update fields
-        model.email = entity.email
-        model.username = entity.username
-        model.hashed_password = entity.hashed_password
-        model.is_active = entity.is_active
-
-        await self.session.flush()
-        await self.session.refresh(model)
+        self._forget_missing(entity)
         return self._to_entity(model)
 
     async def delete(self, entity_id: UUID) -> bool:
         """Delete a user by ID."""
-        stmt = select(UserModel).where(UserModel.id == entity_id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-
+        model = await self.session.get(UserModel, entity_id)
         if not model:
             return False
 
@@ -100,19 +127,49 @@ class UserRepository(IUserRepository):
 
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[UserEntity]:
         """List all users with pagination."""
-        stmt = select(UserModel).offset(skip).limit(limit)
+        stmt = lambda_stmt(lambda: select(UserModel).offset(skip).limit(limit))
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        return [self._to_entity(model) for model in result.scalars()]
 
     async def exists_by_email(self, email: str) -> bool:
         """Check if user exists by email."""
-        stmt = select(UserModel.id).where(UserModel.email == email)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        if ("email", email) in _missing_users:
+            return False
+        found = bool(await self.session.scalar(select(exists().where(UserModel.email == email))))
+        if not found:
+            _missing_users.set(("email", email), True)
+        return found
 
     async def exists_by_username(self, username: str) -> bool:
         """Check if user exists by username."""
-        stmt = select(UserModel.id).where(UserModel.username == username)
+        if ("username", username) in _missing_users:
+            return False
+        found = bool(await self.session.scalar(select(exists().where(UserModel.username == username))))
+        if not found:
+            _missing_users.set(("username", username), True)
+        return found
+
+    async def get_with_email_conflict(self, user_id: UUID, email: str) -> Tuple[Optional[UserEntity], bool]:
+        """Get user by ID and whether another user already has ``email``."""
+        conflict = exists().where(UserModel.email == email, UserModel.id != user_id)
+        stmt = select(UserModel, conflict.label("email_taken")).where(UserModel.id == user_id)
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
\ No newline at end of file
+        row = result.one_or_none()
+        if row is None:
+            return None, False
+        return self._to_entity(row[0]), bool(row.email_taken)
+
+    async def exists_by_email_or_username(self, email: str, username: str) -> Tuple[bool, bool]:
+        """Check in one query whether the email and/or username are taken."""
+        if ("email", email) in _missing_users and ("username", username) in _missing_users:
+            return False, False
+        stmt = select(
+            exists().where(UserModel.email == email),
+            exists().where(UserModel.username == username)
+        )
+        email_exists, username_exists = map(bool, (await self.session.execute(stmt)).one())
+        if not email_exists:
+            _missing_users.set(("email", email), True)
+        if not username_exists:
+            _missing_users.set(("username", username), True)
+        return email_exists, username_exists
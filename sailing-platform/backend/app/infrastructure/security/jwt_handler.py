@@ -1,9 +1,34 @@
 """JWT token handling service."""
+import base64
+import calendar
+import hashlib
+import hmac
+import json
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
+from uuid import UUID
 from jose import JWTError, jwt
 
-from app.config import settings
+from app.config import get_settings
+from app.infrastructure.cache import TTLCache
+
+settings = get_settings()
+
+# Tokens of the same user carry the same subject, so parsing is memoized
+_parse_uuid = lru_cache(maxsize=8192)(UUID)
+
+# HMAC algorithms signed without going through python-jose
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+# Verified payloads are reused for at most this long (and never past the token's exp)
+_DECODE_CACHE_TTL = 30.0
+_DECODE_CACHE_SIZE = 10_000
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
 
 
 class JWTHandler:
@@ -14,25 +39,66 @@ class JWTHandler:
         self.algorithm = settings.ALGORITHM
         self.access_token_expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+        # For HS* the header and keyed HMAC state never change, so build them once;
+        # tokens match python-jose's output byte for byte
+        digest = _HMAC_DIGESTS.get(self.algorithm)
+        if digest is not None:
+            header = json.dumps({"alg": self.algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True)
+            self._signing_input_prefix = _b64url(header.encode()) + b"."
+            self._hmac = hmac.new(self.secret_key.encode(), digestmod=digest)
+        else:
+            self._hmac = None
+
+        self._decoded: TTLCache[str, Dict[str, Any]] = TTLCache(_DECODE_CACHE_TTL, _DECODE_CACHE_SIZE)
+
     def create_access_token(self, data: Dict[str, Any]) -> str:
         """Create a new JWT access token."""
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        if self._hmac is None:
+            to_encode.update({"exp": expire})
+            return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+
+        to_encode["exp"] = calendar.timegm(expire.utctimetuple())
+        payload = json.dumps(to_encode, separators=(",", ":")).encode()
+        signing_input = self._signing_input_prefix + _b64url(payload)
+        mac = self._hmac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64url(mac.digest())).decode()
 
     def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """Decode and verify a JWT token."""
+        """Decode and verify a JWT token.
+
+        Successfully verified tokens are remembered briefly, so a client sending the
+        same token on consecutive requests skips signature checking and JSON parsing.
+        The returned payload is shared and must not be mutated.
+        """
+        cached = self._decoded.get(token)
+        if cached is not None:
+            return cached
+
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
         except JWTError:
             return None
 
+        exp = payload.get("exp")
+        self._decoded.set(token, payload, exp - time.time() if isinstance(exp, (int, float)) else None)
+        return payload
+
     def get_user_id_from_token(self, token: str) -> Optional[str]:
         """Extract user ID from token."""
         payload = self.decode_token(token)
         if payload:
             return payload.get("sub")
-        return None
\ No newline at end of file
+        return None
+
+    def get_user_uuid_from_token(self, token: str) -> Optional[UUID]:
+        """Extract user ID from token as a UUID."""
+        user_id = self.get_user_id_from_token(token)
+        if user_id is None:
+            return None
+        try:
+            return _parse_uuid(user_id)
+        except (TypeError, ValueError):
+            return None
@@ -1,6 +1,15 @@
-"""Password hashing service using passlib."""
+"""Password hashing service using bcrypt."""
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
 from abc import ABC, abstractmethod
-from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from app.infrastructure.cache import TTLCache
 
 
 class IPasswordHasher(ABC):
@@ -16,17 +25,75 @@ class IPasswordHasher(ABC):
         """Verify a password against a hash."""
         pass
 
+    @abstractmethod
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a plain password without blocking the event loop."""
+        pass
+
+    @abstractmethod
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a hash without blocking the event loop."""
+        pass
+
+
+# Short-lived, process-wide memory of successful password verifications.
+# Keys are HMACs under a random per-process pepper, so neither passwords nor
+# anything derived from them without the pepper are kept. Only successes are
+# remembered: wrong guesses always pay the full bcrypt cost.
+_pepper = secrets.token_bytes(32)
+_verified: TTLCache[bytes, bool] = TTLCache(ttl=60.0, maxsize=1024)
+
+
+def _verified_key(plain_password: str, hashed_password: str) -> bytes:
+    message = hashed_password.encode() + b"\0" + plain_password.encode()
+    return hmac.new(_pepper, message, hashlib.sha256).digest()
+
+
+# Work factor for new hashes; matches passlib's bcrypt default, so existing hashes verify unchanged
+_BCRYPT_ROUNDS = 12
+
+# bcrypt releases the GIL, so one thread per core runs that many hashes in parallel
+_kdf_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
 
 class PasswordHasher(IPasswordHasher):
     """Password hasher implementation using bcrypt."""
 
-    def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def _hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)).decode()
+
+    def _check(self, plain_password: str, hashed_password: str) -> bool:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
     def hash_password(self, password: str) -> str:
         """Hash a plain password using bcrypt."""
-        return self.pwd_context.hash(password)
+        return self._hash(password)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against a bcrypt hash."""
-        return self.pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+        """Verify a password against a bcrypt hash.
+
+        A repeat of a recent successful check is answered without running bcrypt.
+        """
+        key = _verified_key(plain_password, hashed_password)
+        if key in _verified:
+            return True
+        if not self._check(plain_password, hashed_password):
+            return False
+        _verified.set(key, True)
+        return True
+
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a plain password using bcrypt on the KDF thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_kdf_pool, self._hash, password)
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a bcrypt hash on the KDF thread pool."""
+        key = _verified_key(plain_password, hashed_password)
+        if key in _verified:
+            return True
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(_kdf_pool, self._check, plain_password, hashed_password):
+            return False
+        _verified.set(key, True)
+        return True
@@ -5,10 +5,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
 
-from app.config import settings
+from app.config import get_settings
 from app.infrastructure.database.connection import create_tables, close_database
+from app.presentation.responses import ORJSONResponse
 from app.presentation.routers import auth, sessions, equipment
 
+settings = get_settings()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -52,6 +55,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -62,6 +66,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Session listings return the keyset cursor for the next page in this header
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Mount static files for frontend
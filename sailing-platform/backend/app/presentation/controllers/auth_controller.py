@@ -68,15 +68,15 @@ class AuthController:
 
     async def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify if token is valid."""
-        user_id = self.jwt_handler.get_user_id_from_token(token)
+        user_id = self.jwt_handler.get_user_uuid_from_token(token)
         if not user_id:
             raise ValueError("Invalid token")
 
-        user = await self.auth_service.get_user_by_id(UUID(user_id))
+        user = await self.auth_service.get_user_by_id(user_id)
         if not user or not user.is_active:
             raise ValueError("Invalid or inactive user")
 
         return {
             "valid": True,
-            "user_id": user_id
+            "user_id": str(user_id)
         }
\ No newline at end of file
@@ -2,9 +2,11 @@
 from typing import List, Dict, Any
 from uuid import UUID
 
+import msgspec
+
 from app.domain.services.equipment_service import EquipmentService
 from app.application.schemas.equipment_schemas import (
-    EquipmentCreate,
+    EquipmentCreateStruct,
     EquipmentUpdate
 )
 
@@ -18,13 +20,13 @@ class EquipmentController:
     async def create_equipment(
             self,
             user_id: UUID,
-            equipment_data: EquipmentCreate
+            equipment_data: EquipmentCreateStruct
     ) -> Dict[str, Any]:
         """Create new equipment."""
         try:
             equipment = await self.equipment_service.create_equipment(
                 user_id=user_id,
-                equipment_data=equipment_data.model_dump()
+                equipment_data=msgspec.structs.asdict(equipment_data)
             )
             return {"equipment": equipment}
         except ValueError as e:
@@ -1,16 +1,35 @@
 """Session controller handling sailing session business logic."""
-from typing import List, Optional, Dict, Any
+import base64
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date
 from uuid import UUID
 
+import msgspec
+
 from app.domain.services.session_service import SessionService
 from app.application.schemas.session_schemas import (
-    SessionCreate,
+    SessionCreateStruct,
     SessionUpdate,
-    EquipmentSettingsCreate
+    EquipmentSettingsCreateStruct
 )
 
 
+def encode_cursor(session_date: date, session_id: UUID) -> str:
+    """Encode a session's (date, id) as an opaque page cursor."""
+    raw = f"{session_date.isoformat()}|{session_id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, UUID]:
+    """Decode a page cursor back into (date, id)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        session_date, session_id = raw.split("|")
+        return date.fromisoformat(session_date), UUID(session_id)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+
 class SessionController:
     """Controller for sailing session operations."""
 
@@ -20,13 +39,13 @@ class SessionController:
     async def create_session(
             self,
             user_id: UUID,
-            session_data: SessionCreate
+            session_data: SessionCreateStruct
     ) -> Dict[str, Any]:
         """Create a new sailing session."""
         try:
             session = await self.session_service.create_session(
                 user_id=user_id,
-                session_data=session_data.model_dump()
+                session_data=msgspec.structs.asdict(session_data)
             )
             return {"session": session}
         except ValueError as e:
@@ -36,15 +55,19 @@ class SessionController:
             self,
             user_id: UUID,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get all sessions for a user."""
+        """Get a page of sessions for a user, plus the cursor for the next page."""
         sessions = await self.session_service.get_user_sessions(
             user_id=user_id,
             skip=skip,
-            limit=limit
+            limit=limit,
+            after=decode_cursor(cursor) if cursor else None
         )
-        return {"sessions": sessions}
+        # A short page is the last one
+        next_cursor = encode_cursor(sessions[-1].date, sessions[-1].id) if len(sessions) == limit else None
+        return {"sessions": sessions, "next_cursor": next_cursor}
 
     async def get_session_with_settings(
             self,
@@ -123,14 +146,14 @@ class SessionController:
             self,
             session_id: UUID,
             user_id: UUID,
-            settings_data: EquipmentSettingsCreate
+            settings_data: EquipmentSettingsCreateStruct
     ) -> Dict[str, Any]:
         """Create equipment settings for a session."""
         try:
             settings = await self.session_service.create_equipment_settings(
                 session_id=session_id,
                 user_id=user_id,
-                settings_data=settings_data.model_dump()
+                settings_data=msgspec.structs.asdict(settings_data)
             )
 
             if not settings:
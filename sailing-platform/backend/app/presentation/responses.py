@@ -0,0 +1,17 @@
+"""Response classes used by the API."""
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """JSON response rendered by orjson.
+
+    Handles UUID, date and datetime values natively, so route handlers may
+    pass ``model.model_dump()`` output straight through. No options are set:
+    naive timestamps keep the same format as Pydantic's ``dump_json``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -2,9 +2,16 @@
 from typing import Annotated, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-
-from app.dependencies import get_equipment_service, get_current_user_id, get_session_service
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+
+from app.dependencies import (
+    get_equipment_service,
+    get_current_user_id,
+    get_session_service,
+    msgspec_body,
+    openapi_body,
+    validated_body
+)
 from app.domain.services.equipment_service import EquipmentService
 from app.domain.services.session_service import SessionService
 from app.presentation.controllers.equipment_controller import EquipmentController
@@ -13,21 +20,25 @@ from app.presentation.controllers.session_controller import SessionController
 from app.presentation.views.session_view import SessionView
 from app.application.schemas.equipment_schemas import (
     EquipmentCreate,
+    EquipmentCreateStruct,
+    EquipmentListAdapter,
     EquipmentUpdate,
     EquipmentResponse,
     EquipmentStatistics
 )
 from app.application.schemas.session_schemas import (
     EquipmentSettingsCreate,
+    EquipmentSettingsCreateStruct,
     EquipmentSettingsResponse
 )
 
 router = APIRouter()
 
 
-@router.post("/", response_model=EquipmentResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=EquipmentResponse, status_code=status.HTTP_201_CREATED,
+             openapi_extra=openapi_body(EquipmentCreate))
 async def create_equipment(
-        equipment_data: EquipmentCreate,
+        equipment_data: Annotated[EquipmentCreateStruct, Depends(msgspec_body(EquipmentCreateStruct, EquipmentCreate))],
         current_user_id: Annotated[UUID, Depends(get_current_user_id)],
         equipment_service: Annotated[EquipmentService, Depends(get_equipment_service)]
 ):
@@ -56,7 +67,8 @@ async def list_equipment(
     view = EquipmentView()
 
     result = await controller.get_user_equipment(current_user_id, active_only)
-    return view.format_equipment_list_response(result["equipment"])
+    items = view.format_equipment_list_response(result["equipment"])
+    return Response(EquipmentListAdapter.dump_json(items), media_type="application/json")
 
 
 @router.get("/analytics/stats", response_model=EquipmentStatistics)
@@ -92,10 +104,10 @@ async def get_equipment(
         )
 
 
-@router.put("/{equipment_id}", response_model=EquipmentResponse)
+@router.put("/{equipment_id}", response_model=EquipmentResponse, openapi_extra=openapi_body(EquipmentUpdate))
 async def update_equipment(
         equipment_id: UUID,
-        update_data: EquipmentUpdate,
+        update_data: Annotated[EquipmentUpdate, Depends(validated_body(EquipmentUpdate))],
         current_user_id: Annotated[UUID, Depends(get_current_user_id)],
         equipment_service: Annotated[EquipmentService, Depends(get_equipment_service)]
 ):
@@ -173,10 +185,13 @@ async def delete_equipment(
 
 # Equipment settings endpoints (alternative to session endpoints)
 @router.post("/sessions/{session_id}/settings", response_model=EquipmentSettingsResponse,
-             status_code=status.HTTP_201_CREATED)
+             status_code=status.HTTP_201_CREATED, openapi_extra=openapi_body(EquipmentSettingsCreate))
 async def create_equipment_settings(
         session_id: UUID,
-        settings_data: EquipmentSettingsCreate,
+        settings_data: Annotated[
+            EquipmentSettingsCreateStruct,
+            Depends(msgspec_body(EquipmentSettingsCreateStruct, EquipmentSettingsCreate))
+        ],
         current_user_id: Annotated[UUID, Depends(get_current_user_id)],
         session_service: Annotated[SessionService, Depends(get_session_service)]
 ):
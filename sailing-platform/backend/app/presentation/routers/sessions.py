@@ -3,30 +3,41 @@ from typing import Annotated, List, Optional
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-
-from app.dependencies import get_session_service, get_current_user_id
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+
+from app.dependencies import (
+    get_session_service,
+    get_current_user_id,
+    msgspec_body,
+    openapi_body,
+    validated_body
+)
 from app.domain.services.session_service import SessionService
 from app.presentation.controllers.session_controller import SessionController
+from app.presentation.responses import ORJSONResponse
 from app.presentation.views.session_view import SessionView
 from app.application.schemas.session_schemas import (
     SessionCreate,
+    SessionCreateStruct,
+    SessionListAdapter,
     SessionUpdate,
     SessionResponse,
     SessionWithEquipmentResponse,
     SessionWithSettingsResponse,
     EquipmentSettingsCreate,
+    EquipmentSettingsCreateStruct,
     EquipmentSettingsResponse,
     PerformanceAnalytics
 )
-from app.application.schemas.equipment_schemas import EquipmentResponse
+from app.application.schemas.equipment_schemas import EquipmentListAdapter, EquipmentResponse
 
 router = APIRouter()
 
 
-@router.post("/", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=SessionResponse, status_code=status.HTTP_201_CREATED,
+             openapi_extra=openapi_body(SessionCreate))
 async def create_session(
-        session_data: SessionCreate,
+        session_data: Annotated[SessionCreateStruct, Depends(msgspec_body(SessionCreateStruct, SessionCreate))],
         current_user_id: Annotated[UUID, Depends(get_current_user_id)],
         session_service: Annotated[SessionService, Depends(get_session_service)]
 ):
@@ -49,14 +60,27 @@ async def list_sessions(
         current_user_id: Annotated[UUID, Depends(get_current_user_id)],
         session_service: Annotated[SessionService, Depends(get_session_service)],
         skip: int = Query(0, ge=0),
-        limit: int = Query(100, ge=1, le=100)
+        limit: int = Query(100, ge=1, le=100),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page")
 ):
-    """List all sessions for the current user."""
+    """List sessions for the current user, newest first.
+
+    When more sessions may follow, the ``X-Next-Cursor`` header holds the cursor
+    for the next page.
+    """
     controller = SessionController(session_service)
     view = SessionView()
 
-    result = await controller.get_user_sessions(current_user_id, skip, limit)
-    return view.format_sessions_list_response(result["sessions"])
+    try:
+        result = await controller.get_user_sessions(current_user_id, skip, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    items = view.format_sessions_list_response(result["sessions"])
+    headers = {"X-Next-Cursor": result["next_cursor"]} if result["next_cursor"] else None
+    return Response(SessionListAdapter.dump_json(items), media_type="application/json", headers=headers)
 
 
 @router.get("/analytics/performance", response_model=PerformanceAnalytics)
@@ -93,11 +117,13 @@ async def get_session(
         # Also get equipment for the session
         equipment_result = await controller.get_session_equipment(session_id, current_user_id)
 
-        return view.format_session_with_settings_response(
+        response = view.format_session_with_settings_response(
             result["session"],
             result["equipment_settings"],
             equipment_result.get("equipment", [])
         )
+        # Built from trusted data; serialize once instead of re-validating via response_model
+        return ORJSONResponse(response.model_dump())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -120,25 +146,8 @@ async def get_session_equipment(
         equipment_list = result["equipment"]
 
         # Format equipment responses
-        return [
-            EquipmentResponse(
-                id=eq.id,
-                name=eq.name,
-                type=eq.type,
-                manufacturer=eq.manufacturer,
-                model=eq.model,
-                purchase_date=eq.purchase_date,
-                notes=eq.notes,
-                active=eq.active,
-                wear=eq.wear,
-                owner_id=eq.owner_id,
-                created_at=eq.created_at,
-                updated_at=eq.updated_at,
-                age_in_days=eq.age_in_days,
-                needs_replacement=eq.needs_replacement()
-            )
-            for eq in equipment_list
-        ]
+        items = EquipmentResponse.list_from_orm_fast(equipment_list)
+        return Response(EquipmentListAdapter.dump_json(items), media_type="application/json")
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -146,10 +155,10 @@ async def get_session_equipment(
         )
 
 
-@router.put("/{session_id}", response_model=SessionResponse)
+@router.put("/{session_id}", response_model=SessionResponse, openapi_extra=openapi_body(SessionUpdate))
 async def update_session(
         session_id: UUID,
-        update_data: SessionUpdate,
+        update_data: Annotated[SessionUpdate, Depends(validated_body(SessionUpdate))],
         current_user_id: Annotated[UUID, Depends(get_current_user_id)],
         session_service: Annotated[SessionService, Depends(get_session_service)]
 ):
@@ -185,10 +194,14 @@ async def delete_session(
         )
 
 
-@router.post("/{session_id}/settings", response_model=EquipmentSettingsResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/{session_id}/settings", response_model=EquipmentSettingsResponse, status_code=status.HTTP_201_CREATED,
+             openapi_extra=openapi_body(EquipmentSettingsCreate))
 async def create_equipment_settings(
         session_id: UUID,
-        settings_data: EquipmentSettingsCreate,
+        settings_data: Annotated[
+            EquipmentSettingsCreateStruct,
+            Depends(msgspec_body(EquipmentSettingsCreateStruct, EquipmentSettingsCreate))
+        ],
         current_user_id: Annotated[UUID, Depends(get_current_user_id)],
         session_service: Annotated[SessionService, Depends(get_session_service)]
 ):
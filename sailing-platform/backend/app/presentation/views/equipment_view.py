@@ -14,30 +14,12 @@ class EquipmentView:
     @staticmethod
     def format_equipment_response(equipment: Equipment) -> EquipmentResponse:
         """Format a single equipment response."""
-        return EquipmentResponse(
-            id=equipment.id,
-            name=equipment.name,
-            type=equipment.type,
-            manufacturer=equipment.manufacturer,
-            model=equipment.model,
-            purchase_date=equipment.purchase_date,
-            notes=equipment.notes,
-            active=equipment.active,
-            wear=equipment.wear,
-            owner_id=equipment.owner_id,
-            created_at=equipment.created_at,
-            updated_at=equipment.updated_at,
-            age_in_days=equipment.age_in_days,
-            needs_replacement=equipment.needs_replacement()  # Using default threshold
-        )
+        return EquipmentResponse.from_orm_fast(equipment)
 
     @staticmethod
     def format_equipment_list_response(equipment_list: List[Equipment]) -> List[EquipmentResponse]:
         """Format a list of equipment."""
-        return [
-            EquipmentView.format_equipment_response(equipment)
-            for equipment in equipment_list
-        ]
+        return EquipmentResponse.list_from_orm_fast(equipment_list)
 
     @staticmethod
     def format_equipment_statistics_response(stats: Dict[str, Any]) -> EquipmentStatistics:
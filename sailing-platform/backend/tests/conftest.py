@@ -46,8 +46,8 @@ def mock_equipment_repository():
 def mock_password_hasher():
     """Mock password hasher for unit tests."""
     hasher = AsyncMock(spec=PasswordHasher)
-    hasher.hash_password.return_value = "hashed_password"
-    hasher.verify_password.return_value = True
+    hasher.hash_password_async.return_value = "hashed_password"
+    hasher.verify_password_async.return_value = True
     return hasher
 
 
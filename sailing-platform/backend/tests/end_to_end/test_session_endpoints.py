@@ -0,0 +1,187 @@
+"""End-to-end tests for session endpoints."""
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from fastapi import status
+
+from app.main import app
+from app.infrastructure.database.connection import engine, Base
+
+
+SESSION_DATA = {
+    "date": "2024-01-15",
+    "location": "San Francisco Bay",
+    "wind_speed_min": 10.0,
+    "wind_speed_max": 15.0,
+    "wave_type": "Choppy",
+    "wave_direction": "NW",
+    "hours_on_water": 3.5,
+    "performance_rating": 4
+}
+
+
+@pytest_asyncio.fixture
+async def setup_database():
+    """Setup test database."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+async def register(client: AsyncClient, username: str) -> dict:
+    """Register a user and return bearer auth headers."""
+    response = await client.post(
+        "/api/auth/register",
+        json={"email": f"{username}@example.com", "username": username, "password": "password123"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+# Coercions the Pydantic schemas accept, and values they reject
+LAX_VALUES = [
+    ("wind_speed_min", "10"),
+    ("wind_speed_min", True),
+    ("hours_on_water", "2.5"),
+    ("performance_rating", 4.0),
+    ("performance_rating", "4"),
+    ("performance_rating", True),
+    ("date", "2024-01-15T00:00:00"),
+]
+INVALID_VALUES = [
+    ("performance_rating", 4.5),
+    ("date", "20240115"),
+    ("wave_type", "choppy"),
+]
+
+
+@pytest.mark.asyncio
+class TestSessionEndpoints:
+    """Test session endpoints end-to-end."""
+
+    async def test_timestamps_serialized_alike(self, setup_database):
+        """Test list and detail responses render naive timestamps the same way."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = await register(client, "sailor")
+            created = await client.post("/api/sessions/", json=SESSION_DATA, headers=headers)
+            session_id = created.json()["id"]
+
+            listed = (await client.get("/api/sessions/", headers=headers)).json()[0]
+            detail = (await client.get(f"/api/sessions/{session_id}", headers=headers)).json()
+
+            assert detail["created_at"] == listed["created_at"]
+            assert detail["updated_at"] == listed["updated_at"]
+            assert "+" not in detail["created_at"] and not detail["created_at"].endswith("Z")
+
+    async def test_create_session_with_foreign_equipment(self, setup_database):
+        """Test equipment owned by another user cannot be attached to a session."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            owner_headers = await register(client, "owner")
+            other_headers = await register(client, "other")
+            equipment = await client.post(
+                "/api/equipment/",
+                json={"name": "Main", "type": "Mainsail", "manufacturer": "North", "model": "3Di"},
+                headers=owner_headers
+            )
+            equipment_id = equipment.json()["id"]
+
+            response = await client.post(
+                "/api/sessions/",
+                json={**SESSION_DATA, "equipment_ids": [equipment_id]},
+                headers=other_headers
+            )
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert "not found or not owned by user" in response.json()["detail"]
+
+            owned = await client.get(f"/api/equipment/{equipment_id}", headers=owner_headers)
+            assert owned.json()["wear"] == 0.0
+
+    @pytest.mark.parametrize("field,value", LAX_VALUES)
+    async def test_create_and_update_accept_same_coercions(self, setup_database, field, value):
+        """Test POST and PUT accept the same lax input as the Pydantic schemas."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = await register(client, "sailor")
+
+            created = await client.post("/api/sessions/", json={**SESSION_DATA, field: value}, headers=headers)
+            assert created.status_code == status.HTTP_201_CREATED
+
+            updated = await client.put(
+                f"/api/sessions/{created.json()['id']}", json={field: value}, headers=headers
+            )
+            assert updated.status_code == status.HTTP_200_OK
+            assert updated.json()[field] == created.json()[field]
+
+    @pytest.mark.parametrize("field,value", INVALID_VALUES)
+    async def test_create_and_update_reject_same_input(self, setup_database, field, value):
+        """Test POST and PUT reject the same input, located at the field."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = await register(client, "sailor")
+            created = await client.post("/api/sessions/", json=SESSION_DATA, headers=headers)
+
+            rejected_create = await client.post("/api/sessions/", json={**SESSION_DATA, field: value}, headers=headers)
+            rejected_update = await client.put(
+                f"/api/sessions/{created.json()['id']}", json={field: value}, headers=headers
+            )
+
+            for response in (rejected_create, rejected_update):
+                assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+                assert response.json()["detail"][0]["loc"][:2] == ["body", field]
+
+    async def test_cursor_header_exposed_to_browser(self, setup_database):
+        """Test cross-origin clients may read the X-Next-Cursor header."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = await register(client, "sailor")
+
+            response = await client.get(
+                "/api/sessions/", headers={**headers, "Origin": "http://localhost:3000"}
+            )
+
+            assert "x-next-cursor" in response.headers["access-control-expose-headers"].lower()
+
+    async def test_cursor_pagination_walks_all_sessions(self, setup_database):
+        """Test following X-Next-Cursor visits every session once, including same-date ties."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = await register(client, "sailor")
+            session_ids = set()
+            for day in ["2024-01-15"] * 5 + ["2024-01-14"] * 2:
+                created = await client.post("/api/sessions/", json={**SESSION_DATA, "date": day}, headers=headers)
+                session_ids.add(created.json()["id"])
+
+            seen, pages, cursor = [], [], None
+            while True:
+                params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+                response = await client.get("/api/sessions/", params=params, headers=headers)
+                assert response.status_code == status.HTTP_200_OK
+                page = response.json()
+                pages.append(len(page))
+                seen += page
+                cursor = response.headers.get("x-next-cursor")
+                # The cursor is only offered while pages come back full
+                assert (cursor is not None) == (len(page) == 2)
+                if cursor is None:
+                    break
+
+            assert pages == [2, 2, 2, 1]
+            assert [s["id"] for s in seen] == list(dict.fromkeys(s["id"] for s in seen))
+            assert {s["id"] for s in seen} == session_ids
+            assert [s["date"] for s in seen] == sorted((s["date"] for s in seen), reverse=True)
+
+    async def test_malformed_cursor_rejected(self, setup_database):
+        """Test a cursor that does not decode is a 400."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = await register(client, "sailor")
+
+            for cursor in ("not-a-cursor", "MjAyNC0wMS0xNXx6eno"):
+                response = await client.get("/api/sessions/", params={"cursor": cursor}, headers=headers)
+
+                assert response.status_code == status.HTTP_400_BAD_REQUEST
+                assert response.json()["detail"] == "Invalid cursor"
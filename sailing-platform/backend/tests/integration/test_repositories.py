@@ -6,6 +6,7 @@ from uuid import uuid4
 from app.domain.entities.user import User
 from app.domain.entities.session import SailingSession
 from app.domain.entities.equipment import Equipment, EquipmentSettings
+from app.infrastructure.database.models import Session as SessionModel
 from app.infrastructure.database.repositories.user_repository_impl import UserRepository
 from app.infrastructure.database.repositories.session_repository_impl import SessionRepository
 from app.infrastructure.database.repositories.equipment_repository_impl import EquipmentRepository
@@ -127,6 +128,32 @@ class TestUserRepository:
         assert await repository.exists_by_email("other@example.com") is False
         assert await repository.exists_by_username("otheruser") is False
 
+        # Combined check reports each collision separately
+        assert await repository.exists_by_email_or_username("exists@example.com", "otheruser") == (True, False)
+        assert await repository.exists_by_email_or_username("other@example.com", "existsuser") == (False, True)
+        assert await repository.exists_by_email_or_username("other@example.com", "otheruser") == (False, False)
+
+    @pytest.mark.asyncio
+    async def test_unique_conflicts_raise_value_error(self, async_db_session):
+        """Test unique-constraint violations surface as the registration errors."""
+        repository = UserRepository(async_db_session)
+        first = await repository.create(User(email="a@example.com", username="alpha", hashed_password="x"))
+        second = await repository.create(User(email="b@example.com", username="bravo", hashed_password="x"))
+        await async_db_session.commit()
+
+        # The existence checks are bypassed, as when another worker won the race
+        with pytest.raises(ValueError, match="Email already registered"):
+            await repository.create(User(email="a@example.com", username="charlie", hashed_password="x"))
+        await async_db_session.rollback()
+
+        with pytest.raises(ValueError, match="Username already taken"):
+            await repository.create(User(email="c@example.com", username="alpha", hashed_password="x"))
+        await async_db_session.rollback()
+
+        second.email = first.email
+        with pytest.raises(ValueError, match="Email already registered"):
+            await repository.update(second)
+
     @pytest.mark.asyncio
     async def test_list_all_users(self, async_db_session):
         """Test listing all users with pagination."""
@@ -237,6 +264,13 @@ class TestSessionRepository:
         assert len(user2_sessions) == 3
         assert all(s.created_by == user2_id for s in user2_sessions)
 
+        # Keyset pages continue after the last (date, id) seen
+        first_page = await repository.get_by_user(user1_id, limit=2)
+        assert [s.date.day for s in first_page] == [3, 2]
+        last = first_page[-1]
+        second_page = await repository.get_by_user(user1_id, limit=2, after=(last.date, last.id))
+        assert [s.date.day for s in second_page] == [1]
+
     @pytest.mark.asyncio
     async def test_get_sessions_by_date_range(self, async_db_session):
         """Test getting sessions within date range."""
@@ -274,6 +308,146 @@ class TestSessionRepository:
         assert len(in_range) == 2
         assert all(start <= s.date <= end for s in in_range)
 
+    @pytest.mark.asyncio
+    async def test_get_analytics_summary_and_equipment_usage(self, async_db_session):
+        """Test SQL-side analytics aggregates and per-equipment usage counts."""
+        # Setup
+        repository = SessionRepository(async_db_session)
+        equipment_repository = EquipmentRepository(async_db_session)
+        user_id = uuid4()
+        jib = await equipment_repository.create(Equipment(
+            name="Jib", type="Jib", manufacturer="North", model="3Di", owner_id=user_id
+        ))
+
+        for day, location, wind, wave_type, hours, rating, equipment_ids in [
+            (10, "Garda", (4.0, 6.0), "Flat", 1.5, 5, [jib.id]),       # light
+            (20, "Kiel", (22.0, 26.0), "Choppy", 3.0, 2, [jib.id]),    # heavy (wind)
+            (25, "Kiel", (10.0, 15.0), "Choppy", 2.0, 3, []),          # medium
+            (26, "Kiel", (5.0, 6.0), "Large", 1.0, 4, []),             # heavy (waves)
+        ]:
+            await repository.create(SailingSession(
+                date=date(2024, 1, day),
+                location=location,
+                wind_speed_min=wind[0],
+                wind_speed_max=wind[1],
+                wave_type=wave_type,
+                wave_direction="N",
+                hours_on_water=hours,
+                performance_rating=rating,
+                created_by=user_id,
+                equipment_ids=equipment_ids
+            ))
+
+        # Groups ordered by their most recent session
+        summary = await repository.get_analytics_summary(user_id)
+        assert summary["by_condition"] == [("heavy", 2, 4.0, 6), ("medium", 1, 2.0, 3), ("light", 1, 1.5, 5)]
+        assert summary["by_location"] == [("Kiel", 3), ("Garda", 1)]
+
+        summary = await repository.get_analytics_summary(user_id, date(2024, 1, 15), date(2024, 1, 31))
+        assert summary["by_condition"] == [("heavy", 2, 4.0, 6), ("medium", 1, 2.0, 3)]
+        assert await repository.get_analytics_summary(uuid4()) == {"by_condition": [], "by_location": []}
+
+        # The Python side of the bucket agrees with the SQL expression
+        assert [
+            SessionModel(wind_speed_min=lo, wind_speed_max=hi, wave_type=waves).condition_bucket
+            for lo, hi, waves in [(4.0, 6.0, "Flat"), (22.0, 26.0, "Choppy"), (10.0, 15.0, "Choppy"), (5.0, 6.0, "Large")]
+        ] == ["light", "heavy", "medium", "heavy"]
+
+        assert await repository.get_equipment_usage_counts(user_id) == {jib.id: 2}
+        assert await repository.get_equipment_usage_counts(
+            user_id, date(2024, 1, 15), date(2024, 1, 31)
+        ) == {jib.id: 1}
+        assert await repository.get_equipment_usage_counts(uuid4()) == {}
+
+    @pytest.mark.asyncio
+    async def test_get_session_equipment_for_user(self, async_db_session):
+        """Test session equipment is only returned to the session owner."""
+        # Setup
+        repository = SessionRepository(async_db_session)
+        equipment_repository = EquipmentRepository(async_db_session)
+        user_id = uuid4()
+        jib = await equipment_repository.create(Equipment(
+            name="Jib", type="Jib", manufacturer="North", model="3Di", owner_id=user_id
+        ))
+        sessions = [
+            await repository.create(SailingSession(
+                date=date(2024, 1, 15),
+                location="Kiel",
+                wind_speed_min=10.0,
+                wind_speed_max=15.0,
+                wave_type="Choppy",
+                wave_direction="N",
+                hours_on_water=2.0,
+                performance_rating=3,
+                created_by=user_id,
+                equipment_ids=equipment_ids
+            ))
+            for equipment_ids in ([jib.id], [])
+        ]
+
+        # Execute & Assert
+        equipment = await repository.get_session_equipment_for_user(sessions[0].id, user_id)
+        assert [e.id for e in equipment] == [jib.id]
+        assert equipment[0].type == "Jib"
+        assert await repository.get_session_equipment_for_user(sessions[1].id, user_id) == []
+        assert await repository.get_session_equipment_for_user(sessions[0].id, uuid4()) is None
+        assert await repository.get_session_equipment_for_user(uuid4(), user_id) is None
+
+        # Listings carry the equipment IDs too
+        listed = {s.id: s.equipment_ids for s in await repository.get_by_user(user_id)}
+        assert listed == {sessions[0].id: [jib.id], sessions[1].id: []}
+
+    @pytest.mark.asyncio
+    async def test_update_session_adjusts_wear(self, async_db_session):
+        """Test updating hours and equipment keeps equipment wear in sync."""
+        # Setup
+        repository = SessionRepository(async_db_session)
+        equipment_repository = EquipmentRepository(async_db_session)
+        user_id = uuid4()
+        jib, main = [
+            await equipment_repository.create(Equipment(
+                name=name, type=eq_type, manufacturer="North", model="3Di", owner_id=user_id
+            ))
+            for name, eq_type in (("Jib", "Jib"), ("Main", "Mainsail"))
+        ]
+        session = await repository.get_by_id((await repository.create(SailingSession(
+            date=date(2024, 1, 15),
+            location="Kiel",
+            wind_speed_min=10.0,
+            wind_speed_max=15.0,
+            wave_type="Choppy",
+            wave_direction="N",
+            hours_on_water=2.0,
+            performance_rating=3,
+            created_by=user_id,
+            equipment_ids=[jib.id]
+        ))).id)
+
+        # Same equipment, more hours
+        session.update(hours_on_water=3.0)
+        updated = await repository.update(session)
+        assert updated.hours_on_water == 3.0
+        assert (await equipment_repository.get_by_id(jib.id)).wear == 3.0
+
+        # Swap equipment
+        session.update(equipment_ids=[main.id])
+        updated = await repository.update(session)
+        assert updated.equipment_ids == [main.id]
+        assert (await equipment_repository.get_by_id(jib.id)).wear == 0.0
+        assert (await equipment_repository.get_by_id(main.id)).wear == 3.0
+
+        # Swap back while changing hours: the removed sail gives back the old hours
+        session.update(equipment_ids=[jib.id], hours_on_water=1.5)
+        await repository.update(session)
+        assert (await equipment_repository.get_by_id(main.id)).wear == 0.0
+        assert (await equipment_repository.get_by_id(jib.id)).wear == 1.5
+
+        # Only the creator can delete it, which returns the hours
+        assert await repository.delete_if_owned(session.id, uuid4()) is False
+        assert await repository.delete_if_owned(session.id, user_id) is True
+        assert await repository.get_by_id(session.id) is None
+        assert (await equipment_repository.get_by_id(jib.id)).wear == 0.0
+
     @pytest.mark.asyncio
     async def test_session_with_equipment_settings(self, async_db_session):
         """Test session with equipment settings."""
@@ -294,6 +468,8 @@ class TestSessionRepository:
             created_by=user_id
         )
         created_session = await repository.create(session)
+        assert await repository.get_owner_id(created_session.id) == user_id
+        assert await repository.get_owner_id(uuid4()) is None
 
         # Initially no settings
         result = await repository.get_with_settings(created_session.id)
@@ -328,6 +504,19 @@ class TestSessionRepository:
         assert settings_only is not None
         assert settings_only.id == created_settings.id
 
+        # Update settings
+        settings_only.forestay_tension = 8.0
+        settings_only.jib_halyard_tension = "Tight"
+        updated_settings = await repository.update_settings(settings_only)
+        assert updated_settings.forestay_tension == 8.0
+        assert updated_settings.jib_halyard_tension == "Tight"
+        assert (await repository.get_settings_by_session(created_session.id)).forestay_tension == 8.0
+
+        # Deleting a freshly loaded session cascades to its settings
+        async_db_session.expunge_all()
+        assert await repository.delete(created_session.id) is True
+        assert await repository.get_settings_by_session(created_session.id) is None
+
 
 class TestEquipmentRepository:
     """Test EquipmentRepository implementation with real database."""
@@ -488,6 +677,111 @@ class TestEquipmentRepository:
         reactivated = await repository.get_by_id(created.id)
         assert reactivated.active is True
 
+    @pytest.mark.asyncio
+    async def test_get_by_ids(self, async_db_session):
+        """Test fetching several pieces of equipment at once."""
+        # Setup
+        repository = EquipmentRepository(async_db_session)
+        owner_id = uuid4()
+        created = [
+            await repository.create(Equipment(
+                name=name,
+                type="Jib",
+                manufacturer="North",
+                model="3Di",
+                owner_id=owner_id
+            ))
+            for name in ("Jib A", "Jib B")
+        ]
+
+        # Execute
+        found = await repository.get_by_ids([e.id for e in created] + [uuid4()])
+
+        # Assert
+        assert {eq_id: e.name for eq_id, e in found.items()} == {
+            created[0].id: "Jib A",
+            created[1].id: "Jib B",
+        }
+        assert await repository.get_by_ids([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_create_many(self, async_db_session):
+        """Test creating several pieces of equipment in one batch."""
+        # Setup
+        repository = EquipmentRepository(async_db_session)
+        owner_id = uuid4()
+        equipment = [
+            Equipment(name=name, type=eq_type, manufacturer="North", model="3Di", owner_id=owner_id)
+            for name, eq_type in (("Jib A", "Jib"), ("Main A", "Mainsail"))
+        ]
+
+        # Execute
+        created = await repository.create_many(equipment)
+
+        # Assert
+        assert [e.id for e in created] == [e.id for e in equipment]
+        stored = await repository.get_by_user(owner_id)
+        assert [(e.name, e.type) for e in stored] == [("Jib A", "Jib"), ("Main A", "Mainsail")]
+        assert await repository.create_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_owner_scoped_mutations(self, async_db_session):
+        """Test retire/reactivate/delete only apply to the owner's equipment."""
+        # Setup
+        repository = EquipmentRepository(async_db_session)
+        owner_id = uuid4()
+        created = await repository.create(Equipment(
+            name="Owned Jib",
+            type="Jib",
+            manufacturer="North",
+            model="3Di",
+            owner_id=owner_id
+        ))
+
+        # Someone else cannot touch it
+        assert await repository.retire_if_owned(created.id, uuid4()) is False
+        assert await repository.delete_if_owned(created.id, uuid4()) is False
+        assert (await repository.get_by_id(created.id)).active is True
+
+        # The owner can
+        assert await repository.retire_if_owned(created.id, owner_id) is True
+        assert (await repository.get_by_id(created.id)).active is False
+        assert await repository.reactivate_if_owned(created.id, owner_id) is True
+        assert (await repository.get_by_id(created.id)).active is True
+        assert await repository.delete_if_owned(created.id, owner_id) is True
+        assert await repository.get_by_id(created.id) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_equipment_used_in_session(self, async_db_session):
+        """Test deleting equipment also unlinks it from sessions."""
+        # Setup
+        repository = EquipmentRepository(async_db_session)
+        session_repository = SessionRepository(async_db_session)
+        owner_id = uuid4()
+        created = await repository.create(Equipment(
+            name="Used Jib", type="Jib", manufacturer="North", model="3Di", owner_id=owner_id
+        ))
+        session = await session_repository.create(SailingSession(
+            date=date(2024, 1, 15),
+            location="Kiel",
+            wind_speed_min=10.0,
+            wind_speed_max=15.0,
+            wave_type="Choppy",
+            wave_direction="N",
+            hours_on_water=2.0,
+            performance_rating=3,
+            created_by=owner_id,
+            equipment_ids=[created.id]
+        ))
+
+        # Execute
+        assert await repository.delete(created.id) is True
+
+        # Assert
+        assert await repository.delete(created.id) is False
+        assert await session_repository.get_session_equipment_for_user(session.id, owner_id) == []
+        assert await session_repository.get_equipment_usage_counts(owner_id) == {}
+
     @pytest.mark.asyncio
     async def test_update_equipment(self, async_db_session):
         """Test updating equipment."""
@@ -516,4 +810,40 @@ class TestEquipmentRepository:
 
         # Verify persistence
         retrieved = await repository.get_by_id(created.id)
-        assert retrieved.name == "New Name"
\ No newline at end of file
+        assert retrieved.name == "New Name"
+    @pytest.mark.asyncio
+    async def test_get_equipment_statistics(self, async_db_session):
+        """Test aggregate equipment statistics."""
+        # Setup
+        repository = EquipmentRepository(async_db_session)
+        user_id = uuid4()
+        for name, eq_type, active, purchased, wear in [
+            ("Main 1", "Mainsail", True, date(2023, 1, 1), 40.0),
+            ("Main 2", "Mainsail", False, date(2020, 1, 1), 120.0),
+            ("Jib 1", "Jib", True, date(2024, 1, 1), 0.0),
+            ("Mast 1", "Mast", True, None, 10.0),
+        ]:
+            await repository.create(Equipment(
+                name=name,
+                type=eq_type,
+                manufacturer="North",
+                model="3Di",
+                owner_id=user_id,
+                active=active,
+                purchase_date=purchased,
+                wear=wear
+            ))
+
+        # Execute
+        stats = await repository.get_statistics(user_id)
+
+        # Assert
+        assert stats["by_type"] == {"Mainsail": (2, 1), "Jib": (1, 1), "Mast": (1, 1)}
+        assert stats["oldest"] == "Main 2"
+        assert stats["newest"] == "Jib 1"
+        assert stats["most_worn"] == [("Main 2", 120.0), ("Main 1", 40.0), ("Mast 1", 10.0)]
+
+        # Other users see nothing
+        empty = await repository.get_statistics(uuid4())
+        assert empty["by_type"] == {}
+        assert empty["oldest"] is None
@@ -0,0 +1,32 @@
+"""Unit tests for response schema helpers."""
+from datetime import date, timedelta
+from uuid import uuid4
+
+from app.domain.entities.equipment import Equipment
+from app.application.schemas.equipment_schemas import EquipmentResponse
+
+
+def _equipment(index: int) -> Equipment:
+    return Equipment(
+        name=f"Sail {index}",
+        type="Jib",
+        manufacturer="North",
+        model="3Di",
+        owner_id=uuid4(),
+        purchase_date=date(2020, 1, 1) + timedelta(days=index) if index % 3 else None,
+        wear=float(index * 5)
+    )
+
+
+class TestEquipmentDerivedFields:
+    """Test derived equipment response fields."""
+
+    def test_list_from_orm_fast(self):
+        """Test list responses carry the derived fields."""
+        equipment = [_equipment(i) for i in range(3)]
+
+        responses = EquipmentResponse.list_from_orm_fast(equipment)
+
+        assert [r.id for r in responses] == [e.id for e in equipment]
+        assert [r.age_in_days for r in responses] == [e.age_in_days for e in equipment]
+        assert [r.needs_replacement for r in responses] == [False, False, False]
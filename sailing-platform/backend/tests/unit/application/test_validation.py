@@ -0,0 +1,84 @@
+"""Unit tests for generated schema validators."""
+import pytest
+from datetime import date
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from app.application.schemas.session_schemas import SessionUpdate
+from app.application.schemas.equipment_schemas import EquipmentUpdate
+from app.application.schemas.validation import FieldValidationError
+
+
+class TestFastValidator:
+    """Test validators generated by compile_validator."""
+
+    def test_valid_update_is_coerced(self):
+        """Test valid input is type-coerced and unknown keys dropped."""
+        equipment_id = uuid4()
+        data = SessionUpdate.__fast_validate__({
+            "date": "2024-01-15",
+            "wind_speed_min": 10,
+            "wave_type": "Choppy",
+            "equipment_ids": [str(equipment_id)],
+            "unknown": "ignored"
+        })
+
+        assert data == {
+            "date": date(2024, 1, 15),
+            "wind_speed_min": 10.0,
+            "wave_type": "Choppy",
+            "equipment_ids": [equipment_id]
+        }
+
+    def test_bounds_and_types_rejected(self):
+        """Test constraint and type violations raise ValueError."""
+        validate = SessionUpdate.__fast_validate__
+
+        with pytest.raises(ValueError, match="wind_speed_max"):
+            validate({"wind_speed_max": 61})
+        with pytest.raises(ValueError, match="hours_on_water"):
+            validate({"hours_on_water": 0})
+        with pytest.raises(ValueError, match="performance_rating"):
+            validate({"performance_rating": 3.5})
+        with pytest.raises(ValueError, match="wave_type"):
+            validate({"wave_type": "Huge"})
+        with pytest.raises(ValueError, match="location"):
+            validate({"location": ""})
+
+    def test_missing_optional_fields_skipped(self):
+        """Test missing or null optional fields are left out."""
+        assert EquipmentUpdate.__fast_validate__({"name": "Jib", "notes": None}) == {"name": "Jib"}
+
+    @pytest.mark.parametrize("field,value", [
+        ("performance_rating", 3.0),
+        ("performance_rating", "4"),
+        ("performance_rating", True),
+        ("hours_on_water", "2.5"),
+        ("wind_speed_min", True),
+        ("date", "2024-01-15T00:00:00"),
+        ("date", 1705276800),
+        ("date", "20240115"),
+        ("date", "2024-02-30"),
+        ("location", 12),
+        ("wave_type", "choppy"),
+        ("equipment_ids", ["not-a-uuid"]),
+    ])
+    def test_matches_pydantic(self, field, value):
+        """Test lax coercions and rejections agree with the Pydantic schema."""
+        try:
+            expected = getattr(SessionUpdate(**{field: value}), field)
+        except ValidationError as e:
+            with pytest.raises(FieldValidationError) as exc_info:
+                SessionUpdate.__fast_validate__({field: value})
+            error = e.errors()[0]
+            assert (exc_info.value.loc, exc_info.value.type) == (error["loc"], error["type"])
+        else:
+            assert SessionUpdate.__fast_validate__({field: value}) == {field: expected}
+
+    def test_error_is_located_at_field(self):
+        """Test errors carry the field path, including list positions."""
+        with pytest.raises(FieldValidationError) as exc_info:
+            SessionUpdate.__fast_validate__({"equipment_ids": [str(uuid4()), 5]})
+
+        assert exc_info.value.loc == ("equipment_ids", 1)
@@ -1,10 +1,13 @@
 """Unit tests for domain entities."""
+import json
+import sys
 import pytest
+from dataclasses import fields
 from datetime import date, datetime
 from uuid import uuid4
 
 from app.domain.entities.user import User
-from app.domain.entities.session import SailingSession
+from app.domain.entities.session import SailingSession, WaveSeverity
 from app.domain.entities.equipment import Equipment, EquipmentSettings
 
 
@@ -77,6 +80,19 @@ class TestUserEntity:
                 hashed_password="hashed"
             )
 
+        # Only underscores and hyphens
+        for username in ("---", "___", "-_-"):
+            with pytest.raises(ValueError, match="Username can only contain"):
+                User(
+                    email="john@example.com",
+                    username=username,
+                    hashed_password="hashed"
+                )
+
+        # Underscores and hyphens alongside letters or digits
+        for username in ("john_doe", "-j-", "__1"):
+            assert User(email="john@example.com", username=username, hashed_password="hashed").username == username
+
     def test_user_deactivate_activate(self):
         """Test user activation/deactivation."""
         user = User(
@@ -136,6 +152,8 @@ class TestSailingSessionEntity:
         assert session.wind_range == 5.0
         assert session.is_heavy_weather() is False
         assert session.is_light_weather() is False
+        assert session.updated_at == session.created_at
+        assert session.wave_severity is WaveSeverity.CHOPPY
 
     def test_session_wind_speed_validation(self):
         """Test wind speed validation."""
@@ -244,6 +262,78 @@ class TestSailingSessionEntity:
         assert light_session.is_light_weather() is True
 
 
+    def test_session_update_validation(self):
+        """Test update validates changed fields and rolls back on error."""
+        session = SailingSession(
+            date=date(2024, 1, 15),
+            location="San Francisco Bay",
+            wind_speed_min=10.0,
+            wind_speed_max=15.0,
+            wave_type="Choppy",
+            wave_direction="NW",
+            hours_on_water=3.5,
+            performance_rating=4,
+            created_by=uuid4()
+        )
+
+        session.update(notes="Windy", location="".join(["Berk", "eley"]))
+        assert session.location is sys.intern("Berkeley")
+
+        with pytest.raises(ValueError, match="Minimum wind speed cannot exceed"):
+            session.update(wind_speed_min=20.0, notes="Changed")
+        assert session.wind_speed_min == 10.0
+        assert session.notes == "Windy"
+
+        with pytest.raises(ValueError, match="Wave type must be one of"):
+            session.update(wave_type="Huge")
+        assert session.wave_type == "Choppy"
+
+        session.update(wave_type="Large")
+        assert session.wave_severity is WaveSeverity.LARGE
+        assert session.is_heavy_weather() is True
+
+        # Derived values follow a rollback
+        with pytest.raises(ValueError, match="Performance rating"):
+            session.update(wind_speed_max=30.0, wave_type="Flat", performance_rating=9)
+        assert session.average_wind_speed == 12.5
+        assert session.wave_severity is WaveSeverity.LARGE
+
+        session.update(wind_speed_min=2.0, wind_speed_max=4.0, wave_type="Flat")
+        assert session.average_wind_speed == 3.0
+        assert session.is_light_weather() is True
+
+    def test_session_from_trusted(self):
+        """Test building a session from trusted data fills derived fields."""
+        session = SailingSession(
+            date=date(2024, 1, 15),
+            location="San Francisco Bay",
+            wind_speed_min=18.0,
+            wind_speed_max=26.0,
+            wave_type="Medium",
+            wave_direction="NW",
+            hours_on_water=3.5,
+            performance_rating=4,
+            created_by=uuid4()
+        )
+        values = {f: getattr(session, f) for f in (
+            "date", "location", "wind_speed_min", "wind_speed_max", "wave_type",
+            "wave_direction", "hours_on_water", "performance_rating", "created_by",
+            "notes", "equipment_ids", "id", "created_at", "updated_at"
+        )}
+
+        trusted = SailingSession.from_trusted(**values)
+        assert trusted == session
+        assert trusted.wave_severity is WaveSeverity.MEDIUM
+        assert trusted.average_wind_speed == 22.0
+        assert trusted.is_heavy_weather() is True
+
+        values["updated_at"] = None
+        assert SailingSession.from_trusted(**values).updated_at == session.created_at
+
+        # No validation on the trusted path
+        values["performance_rating"] = 9
+        assert SailingSession.from_trusted(**values).performance_rating == 9
+
 class TestEquipmentEntity:
     """Test Equipment domain entity."""
 
@@ -328,6 +418,8 @@ class TestEquipmentEntity:
         )
 
         assert equipment.age_in_days > 1000  # More than ~3 years
+        assert equipment.age_in_days_from(old_date) == 0
+        assert equipment.age_in_days_from(date.today()) == equipment.age_in_days
         assert equipment.is_old(threshold_days=1000) is True
         assert equipment.is_old(threshold_days=2000) is False
 
@@ -341,8 +433,23 @@ class TestEquipmentEntity:
         )
 
         assert new_equipment.age_in_days is None
+        assert new_equipment.age_in_days_from(date.today()) is None
         assert new_equipment.is_old() is False
 
+    def test_equipment_from_row(self):
+        """Test building equipment from positional values in field order."""
+        equipment = Equipment(
+            name="Row Jib",
+            type="Jib",
+            manufacturer="North",
+            model="3Di",
+            owner_id=uuid4(),
+            wear=12.5
+        )
+        row = tuple(getattr(equipment, f.name) for f in fields(Equipment))
+
+        assert Equipment.from_row(row) == equipment
+
 
 class TestEquipmentSettingsEntity:
     """Test EquipmentSettings domain entity."""
@@ -421,6 +528,50 @@ class TestEquipmentSettingsEntity:
                 vang=6.0
             )
 
+    def test_settings_from_trusted(self):
+        """Test building settings from trusted data skips validation."""
+        settings = EquipmentSettings(
+            session_id=uuid4(),
+            forestay_tension=5.0,
+            shroud_tension=5.0,
+            mast_rake=2.0,
+            jib_halyard_tension="Tight",
+            cunningham=5.0,
+            outhaul=5.0,
+            vang=5.0,
+            pre_bend=12.0
+        )
+        values = {f: getattr(settings, f) for f in settings.__slots__}
+
+        trusted = EquipmentSettings.from_trusted(**values)
+        assert trusted == settings
+
+        # No validation on the trusted path
+        values["forestay_tension"] = 11.0
+        assert EquipmentSettings.from_trusted(**values).forestay_tension == 11.0
+
+        # Every field is required
+        del values["pre_bend"]
+        with pytest.raises(KeyError):
+            EquipmentSettings.from_trusted(**values)
+
+    def test_light_setup_compares_halyard_by_value(self):
+        """Test a halyard value that bypassed validation is still recognised."""
+        settings = EquipmentSettings(
+            session_id=uuid4(),
+            forestay_tension=3.0,
+            shroud_tension=3.5,
+            mast_rake=4.0,
+            jib_halyard_tension="Tight",
+            cunningham=2.0,
+            outhaul=3.0,
+            vang=2.5
+        )
+
+        settings.jib_halyard_tension = json.loads('"Loose"')
+
+        assert settings.is_light_weather_setup is True
+
     def test_settings_weather_setup_detection(self):
         """Test weather setup detection."""
         # Heavy weather setup
@@ -0,0 +1,31 @@
+"""Unit tests for entity identifier generation."""
+import time
+
+from app.domain.entities.ids import uuid7
+from app.domain.entities.user import User
+
+
+def test_uuid7_layout():
+    """Test version/variant bits and the embedded millisecond timestamp."""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_time_ordered():
+    """Test IDs from later milliseconds sort after earlier ones."""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first < second
+    assert len({uuid7() for _ in range(1000)}) == 1000
+
+
+def test_entities_use_uuid7():
+    """Test new entities get time-ordered IDs."""
+    user = User(email="test@example.com", username="testuser", hashed_password="hashed")
+    assert user.id.version == 7
@@ -19,8 +19,7 @@ class TestAuthService:
     async def test_register_user_success(self, mock_user_repository, mock_password_hasher):
         """Test successful user registration."""
         # Setup
-        mock_user_repository.exists_by_email.return_value = False
-        mock_user_repository.exists_by_username.return_value = False
+        mock_user_repository.exists_by_email_or_username.return_value = (False, False)
         mock_user_repository.create.return_value = User(
             id=uuid4(),
             email="new@example.com",
@@ -40,14 +39,14 @@ class TestAuthService:
         # Assert
         assert user.email == "new@example.com"
         assert user.username == "newuser"
-        mock_password_hasher.hash_password.assert_called_once_with("password123")
+        mock_password_hasher.hash_password_async.assert_called_once_with("password123")
         mock_user_repository.create.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_register_user_email_exists(self, mock_user_repository, mock_password_hasher):
         """Test registration with existing email."""
         # Setup
-        mock_user_repository.exists_by_email.return_value = True
+        mock_user_repository.exists_by_email_or_username.return_value = (True, False)
 
         service = AuthService(mock_user_repository, mock_password_hasher)
 
@@ -63,8 +62,7 @@ class TestAuthService:
     async def test_register_user_username_exists(self, mock_user_repository, mock_password_hasher):
         """Test registration with existing username."""
         # Setup
-        mock_user_repository.exists_by_email.return_value = False
-        mock_user_repository.exists_by_username.return_value = True
+        mock_user_repository.exists_by_email_or_username.return_value = (False, True)
 
         service = AuthService(mock_user_repository, mock_password_hasher)
 
@@ -80,8 +78,7 @@ class TestAuthService:
     async def test_register_user_weak_password(self, mock_user_repository, mock_password_hasher):
         """Test registration with weak password."""
         # Setup
-        mock_user_repository.exists_by_email.return_value = False
-        mock_user_repository.exists_by_username.return_value = False
+        mock_user_repository.exists_by_email_or_username.return_value = (False, False)
 
         service = AuthService(mock_user_repository, mock_password_hasher)
 
@@ -115,7 +112,7 @@ class TestAuthService:
         # Setup
         sample_user.is_active = True
         mock_user_repository.get_by_username.return_value = sample_user
-        mock_password_hasher.verify_password.return_value = True
+        mock_password_hasher.verify_password_async.return_value = True
 
         service = AuthService(mock_user_repository, mock_password_hasher)
 
@@ -125,7 +122,7 @@ class TestAuthService:
         # Assert
         assert user is not None
         assert user.username == "testuser"
-        mock_password_hasher.verify_password.assert_called_once_with(
+        mock_password_hasher.verify_password_async.assert_called_once_with(
             "password123", sample_user.hashed_password
         )
 
@@ -142,7 +139,7 @@ class TestAuthService:
 
         # Assert
         assert user is None
-        mock_password_hasher.verify_password.assert_not_called()
+        mock_password_hasher.verify_password_async.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_authenticate_user_inactive(self, mock_user_repository, mock_password_hasher, sample_user):
@@ -164,7 +161,7 @@ class TestAuthService:
         """Test authentication with wrong password."""
         # Setup
         mock_user_repository.get_by_username.return_value = sample_user
-        mock_password_hasher.verify_password.return_value = False
+        mock_password_hasher.verify_password_async.return_value = False
 
         service = AuthService(mock_user_repository, mock_password_hasher)
 
@@ -174,6 +171,30 @@ class TestAuthService:
         # Assert
         assert user is None
 
+    @pytest.mark.asyncio
+    async def test_update_user_email(self, mock_user_repository, mock_password_hasher, sample_user):
+        """Test email update uses a single lookup with conflict check."""
+        # Setup
+        mock_user_repository.get_with_email_conflict.return_value = (sample_user, False)
+        mock_user_repository.update.side_effect = lambda user: user
+
+        service = AuthService(mock_user_repository, mock_password_hasher)
+
+        # Execute
+        user = await service.update_user_email(sample_user.id, "changed@example.com")
+
+        # Assert
+        assert user.email == "changed@example.com"
+        mock_user_repository.get_with_email_conflict.assert_called_once_with(
+            sample_user.id, "changed@example.com"
+        )
+        mock_user_repository.get_by_id.assert_not_called()
+
+        # Taken by another user
+        mock_user_repository.get_with_email_conflict.return_value = (sample_user, True)
+        with pytest.raises(ValueError, match="Email already registered"):
+            await service.update_user_email(sample_user.id, "taken@example.com")
+
 
 class TestSessionService:
     """Test SessionService domain service."""
@@ -210,6 +231,43 @@ class TestSessionService:
         assert session.created_by == user_id
         mock_session_repository.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_session_equipment_validation(
+            self, mock_session_repository, mock_equipment_repository, sample_equipment
+    ):
+        """Test equipment is checked with a single batch lookup."""
+        # Setup
+        user_id = sample_equipment.owner_id
+        missing_id = uuid4()
+        session_data = {
+            "date": date(2024, 1, 15),
+            "location": "SF Bay",
+            "wind_speed_min": 10.0,
+            "wind_speed_max": 15.0,
+            "wave_type": "Choppy",
+            "wave_direction": "NW",
+            "hours_on_water": 3.5,
+            "performance_rating": 4,
+            "equipment_ids": [sample_equipment.id, missing_id]
+        }
+        mock_equipment_repository.get_by_ids.return_value = {sample_equipment.id: sample_equipment}
+
+        service = SessionService(mock_session_repository, mock_equipment_repository)
+
+        # Execute & Assert
+        with pytest.raises(ValueError, match=f"Equipment {missing_id} not found"):
+            await service.create_session(user_id, session_data)
+        mock_equipment_repository.get_by_ids.assert_called_once_with(set(session_data["equipment_ids"]))
+        mock_equipment_repository.get_by_id.assert_not_called()
+        mock_session_repository.create.assert_not_called()
+
+        # Known equipment is served from the per-service cache
+        sample_equipment.retire()
+        session_data["equipment_ids"] = [sample_equipment.id, sample_equipment.id]
+        with pytest.raises(ValueError, match="is retired"):
+            await service.create_session(user_id, session_data)
+        mock_equipment_repository.get_by_ids.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_user_sessions(self, mock_session_repository, sample_session):
         """Test getting user sessions."""
@@ -225,7 +283,7 @@ class TestSessionService:
         # Assert
         assert len(sessions) == 1
         assert sessions[0] == sample_session
-        mock_session_repository.get_by_user.assert_called_once_with(user_id, 0, 10)
+        mock_session_repository.get_by_user.assert_called_once_with(user_id, 0, 10, None)
 
     @pytest.mark.asyncio
     async def test_update_session_success(self, mock_session_repository, sample_session):
@@ -273,8 +331,7 @@ class TestSessionService:
         user_id = sample_session.created_by
         session_id = sample_session.id
 
-        mock_session_repository.get_by_id.return_value = sample_session
-        mock_session_repository.delete.return_value = True
+        mock_session_repository.delete_if_owned.return_value = True
 
         service = SessionService(mock_session_repository)
 
@@ -283,53 +340,49 @@ class TestSessionService:
 
         # Assert
         assert success is True
-        mock_session_repository.delete.assert_called_once_with(session_id)
+        mock_session_repository.delete_if_owned.assert_called_once_with(session_id, user_id)
+        mock_session_repository.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_equipment_settings_ownership(self, mock_session_repository):
+        """Test settings creation checks only the session owner."""
+        # Setup
+        user_id = uuid4()
+        session_id = uuid4()
+        settings_data = {
+            "forestay_tension": 7.5,
+            "shroud_tension": 6.0,
+            "mast_rake": 2.5,
+            "jib_halyard_tension": "Medium",
+            "cunningham": 4.0,
+            "outhaul": 5.0,
+            "vang": 6.0
+        }
+        mock_session_repository.get_owner_id.return_value = user_id
+        mock_session_repository.get_settings_by_session.return_value = None
+        mock_session_repository.create_settings.side_effect = lambda settings: settings
+
+        service = SessionService(mock_session_repository)
+
+        # Execute
+        settings = await service.create_equipment_settings(session_id, user_id, settings_data)
+        not_owned = await service.create_equipment_settings(session_id, uuid4(), settings_data)
+
+        # Assert
+        assert settings.session_id == session_id
+        assert not_owned is None
+        mock_session_repository.create_settings.assert_called_once()
+        mock_session_repository.get_by_id.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_performance_analytics(self, mock_session_repository):
         """Test performance analytics calculation."""
         # Setup
         user_id = uuid4()
-        sessions = [
-            SailingSession(
-                id=uuid4(),
-                date=date(2024, 1, 15),
-                location="SF Bay",
-                wind_speed_min=20,
-                wind_speed_max=25,
-                wave_type="Large",
-                wave_direction="NW",
-                hours_on_water=2.0,
-                performance_rating=3,
-                created_by=user_id
-            ),
-            SailingSession(
-                id=uuid4(),
-                date=date(2024, 1, 16),
-                location="SF Bay",
-                wind_speed_min=5,
-                wind_speed_max=8,
-                wave_type="Flat",
-                wave_direction="N",
-                hours_on_water=3.0,
-                performance_rating=5,
-                created_by=user_id
-            ),
-            SailingSession(
-                id=uuid4(),
-                date=date(2024, 1, 17),
-                location="Berkeley",
-                wind_speed_min=12,
-                wind_speed_max=15,
-                wave_type="Choppy",
-                wave_direction="W",
-                hours_on_water=4.0,
-                performance_rating=4,
-                created_by=user_id
-            )
-        ]
-
-        mock_session_repository.get_by_user.return_value = sessions
+        mock_session_repository.get_analytics_summary.return_value = {
+            "by_condition": [("medium", 1, 4.0, 4), ("light", 1, 3.0, 5), ("heavy", 1, 2.0, 3)],
+            "by_location": [("Berkeley", 1), ("SF Bay", 2)],
+        }
 
         service = SessionService(mock_session_repository)
 
@@ -345,6 +398,18 @@ class TestSessionService:
         assert analytics["performance_by_conditions"]["medium"] == 4.0
         assert analytics["sessions_by_location"]["SF Bay"] == 2
         assert analytics["sessions_by_location"]["Berkeley"] == 1
+        mock_session_repository.get_analytics_summary.assert_called_once_with(user_id, None, None)
+
+    @pytest.mark.asyncio
+    async def test_get_performance_analytics_empty(self, mock_session_repository):
+        """Test analytics for a user without sessions."""
+        mock_session_repository.get_analytics_summary.return_value = {"by_condition": [], "by_location": []}
+
+        service = SessionService(mock_session_repository)
+        analytics = await service.get_performance_analytics(uuid4())
+
+        assert analytics["total_sessions"] == 0
+        assert analytics["performance_by_conditions"] == {}
 
 
 class TestEquipmentService:
@@ -386,8 +451,7 @@ class TestEquipmentService:
         user_id = sample_equipment.owner_id
         equipment_id = sample_equipment.id
 
-        mock_equipment_repository.get_by_id.return_value = sample_equipment
-        mock_equipment_repository.retire.return_value = True
+        mock_equipment_repository.retire_if_owned.return_value = True
 
         service = EquipmentService(mock_equipment_repository)
 
@@ -396,7 +460,8 @@ class TestEquipmentService:
 
         # Assert
         assert success is True
-        mock_equipment_repository.retire.assert_called_once_with(equipment_id)
+        mock_equipment_repository.retire_if_owned.assert_called_once_with(equipment_id, user_id)
+        mock_equipment_repository.get_by_id.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_retire_equipment_unauthorized(self, mock_equipment_repository, sample_equipment):
@@ -405,7 +470,7 @@ class TestEquipmentService:
         wrong_user_id = uuid4()
         equipment_id = sample_equipment.id
 
-        mock_equipment_repository.get_by_id.return_value = sample_equipment
+        mock_equipment_repository.retire_if_owned.return_value = False
 
         service = EquipmentService(mock_equipment_repository)
 
@@ -414,6 +479,7 @@ class TestEquipmentService:
 
         # Assert
         assert success is False
+        mock_equipment_repository.retire_if_owned.assert_called_once_with(equipment_id, wrong_user_id)
         mock_equipment_repository.retire.assert_not_called()
 
     @pytest.mark.asyncio
@@ -421,40 +487,12 @@ class TestEquipmentService:
         """Test equipment statistics calculation."""
         # Setup
         user_id = uuid4()
-        equipment_list = [
-            Equipment(
-                id=uuid4(),
-                name="Main 1",
-                type="Mainsail",
-                manufacturer="North",
-                model="3Di",
-                owner_id=user_id,
-                active=True,
-                purchase_date=date(2023, 1, 1)
-            ),
-            Equipment(
-                id=uuid4(),
-                name="Main 2",
-                type="Mainsail",
-                manufacturer="Doyle",
-                model="Stratis",
-                owner_id=user_id,
-                active=False,
-                purchase_date=date(2020, 1, 1)
-            ),
-            Equipment(
-                id=uuid4(),
-                name="Jib 1",
-                type="Jib",
-                manufacturer="North",
-                model="3Di",
-                owner_id=user_id,
-                active=True,
-                purchase_date=date(2024, 1, 1)
-            )
-        ]
-
-        mock_equipment_repository.get_by_user.return_value = equipment_list
+        mock_equipment_repository.get_statistics.return_value = {
+            "by_type": {"Mainsail": (2, 1), "Jib": (1, 1)},
+            "oldest": "Main 2",
+            "newest": "Jib 1",
+            "most_worn": [("Main 2", 120.0), ("Main 1", 40.0)]
+        }
 
         service = EquipmentService(mock_equipment_repository)
 
@@ -468,4 +506,19 @@ class TestEquipmentService:
         assert stats["equipment_by_type"]["Mainsail"] == 2
         assert stats["equipment_by_type"]["Jib"] == 1
         assert stats["oldest_equipment"] == "Main 2"
-        assert stats["newest_equipment"] == "Jib 1"
\ No newline at end of file
+        assert stats["newest_equipment"] == "Jib 1"
+        assert stats["most_worn_equipment"] == {"Main 2": 120.0, "Main 1": 40.0}
+        mock_equipment_repository.get_by_user.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_equipment_statistics_empty(self, mock_equipment_repository):
+        """Test equipment statistics for a user without equipment."""
+        mock_equipment_repository.get_statistics.return_value = {
+            "by_type": {}, "oldest": None, "newest": None, "most_worn": []
+        }
+
+        service = EquipmentService(mock_equipment_repository)
+        stats = await service.get_equipment_statistics(uuid4())
+
+        assert stats["total_equipment"] == 0
+        assert stats["most_worn_equipment"] is None
\ No newline at end of file
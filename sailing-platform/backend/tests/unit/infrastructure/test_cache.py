@@ -0,0 +1,40 @@
+"""Unit tests for the in-process TTL cache."""
+from unittest.mock import patch
+
+from app.infrastructure.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache expiry and eviction."""
+
+    def test_entries_expire(self):
+        """Test entries vanish after their lifetime, and a shorter ttl wins."""
+        cache = TTLCache(ttl=10.0, maxsize=10)
+
+        with patch("app.infrastructure.cache.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=2.0)
+            cache.set("c", 3, ttl=60.0)
+            cache.set("d", 4, ttl=-1.0)
+
+        with patch("app.infrastructure.cache.monotonic", return_value=105.0):
+            assert cache.get("a") == 1
+            assert "b" not in cache
+            assert "d" not in cache
+
+        with patch("app.infrastructure.cache.monotonic", return_value=111.0):
+            assert cache.get("c") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test reads refresh recency so the coldest entry is evicted."""
+        cache = TTLCache(ttl=10.0, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        cache.discard("a")
+        assert "a" not in cache
@@ -0,0 +1,52 @@
+"""Unit tests for the JWT handler."""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from jose import jwt
+
+from app.infrastructure.security.jwt_handler import JWTHandler
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def utcnow(cls):
+        return datetime(2024, 1, 15, 12, 0, 0)
+
+
+class TestJWTHandler:
+    """Test JWTHandler token creation and decoding."""
+
+    def test_token_matches_python_jose(self):
+        """Test the precomputed HMAC path produces python-jose's exact token."""
+        handler = JWTHandler()
+
+        with patch("app.infrastructure.security.jwt_handler.datetime", _FrozenDatetime):
+            token = handler.create_access_token({"sub": "user-1"})
+
+        expire = _FrozenDatetime.utcnow() + timedelta(minutes=handler.access_token_expire_minutes)
+        expected = jwt.encode(
+            {"sub": "user-1", "exp": expire}, handler.secret_key, algorithm=handler.algorithm
+        )
+        assert token == expected
+
+    def test_token_round_trip(self):
+        """Test a freshly created token decodes to its subject."""
+        handler = JWTHandler()
+
+        token = handler.create_access_token({"sub": "user-1"})
+
+        assert handler.get_user_id_from_token(token) == "user-1"
+        assert handler.decode_token(token + "x") is None
+
+    def test_decoded_payload_is_reused(self):
+        """Test a repeated token is served from the decode cache."""
+        handler = JWTHandler()
+        token = handler.create_access_token({"sub": "user-1"})
+
+        with patch("app.infrastructure.security.jwt_handler.jwt.decode", wraps=jwt.decode) as decode:
+            assert handler.get_user_id_from_token(token) == "user-1"
+            assert handler.get_user_id_from_token(token) == "user-1"
+            assert handler.decode_token("not-a-token") is None
+            assert handler.decode_token("not-a-token") is None
+
+        assert decode.call_count == 3
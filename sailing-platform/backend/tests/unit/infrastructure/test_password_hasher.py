@@ -0,0 +1,51 @@
+"""Unit tests for the password hasher."""
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.security.password_hasher import PasswordHasher
+
+
+class TestPasswordHasher:
+    """Test PasswordHasher caching and thread-pool variants."""
+
+    def test_repeated_success_skips_bcrypt(self):
+        """Test a repeated successful verification is served from the cache."""
+        hasher = PasswordHasher()
+        hashed = hasher.hash_password("SecurePass123")
+
+        with patch.object(hasher, "_check", wraps=hasher._check) as check:
+            assert hasher.verify_password("SecurePass123", hashed) is True
+            assert hasher.verify_password("SecurePass123", hashed) is True
+            assert PasswordHasher().verify_password("SecurePass123", hashed) is True
+
+        assert check.call_count == 1
+
+    def test_failures_are_not_cached(self):
+        """Test wrong passwords always go through bcrypt."""
+        hasher = PasswordHasher()
+        hashed = hasher.hash_password("SecurePass123")
+
+        with patch.object(hasher, "_check", wraps=hasher._check) as check:
+            assert hasher.verify_password("WrongPass123", hashed) is False
+            assert hasher.verify_password("WrongPass123", hashed) is False
+
+        assert check.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify(self):
+        """Test the thread-pool variants agree with the synchronous ones."""
+        hasher = PasswordHasher()
+
+        hashed = await hasher.hash_password_async("AsyncPass123")
+
+        assert hasher.verify_password("AsyncPass123", hashed) is True
+        assert await hasher.verify_password_async("AsyncPass123", hashed) is True
+        assert await hasher.verify_password_async("WrongPass123", hashed) is False
+
+    def test_verifies_passlib_hashes(self):
+        """Test hashes written by the former passlib CryptContext still verify."""
+        # passlib bcrypt hash of "SecurePass123" ($2b$, 12 rounds)
+        hashed = "$2b$12$kRSj1dssbN61kIOza3yPreHcP3yK7ogjogRdM/7AbC4L5k1Al5WUK"
+
+        assert PasswordHasher().verify_password("SecurePass123", hashed) is True